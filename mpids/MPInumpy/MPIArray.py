@@ -14,7 +14,8 @@ class MPIArray(np.ndarray):
     """ MPIArray subclass of numpy.ndarray """
 
     def __new__(cls, local_array, comm=MPI.COMM_WORLD, comm_dims=None,
-                comm_coord=None, local_to_global=None):
+                comm_coord=None, local_to_global=None, globalshape=None,
+                globalsize=None, globalnbytes=None):
         """ Create MPIArray from process local array data.
 
         Parameters
@@ -30,13 +31,25 @@ class MPIArray(np.ndarray):
         comm_coord : list
             Rank/Procses cartesian coordinate in communicator
             process grid.
-        local_to_global: dict, None
+        local_to_global: dict, numpy.ndarray, None
             Dictionary specifying global index start/end of data by axis.
             Format:
                 key, value = axis, [inclusive start, exclusive end)
                 {0: (start_index, end_index),
                  1: (start_index, end_index),
                  ...}
+            Alternatively a tuple of (start_index, end_index) pairs or
+            integer array of shape (ndim, 2) indexed by axis, arrays used
+            as is.
+        globalshape : tuple, None
+            Combined shape of distributed array, if known.  When specified
+            the global properties are resolved without communication.
+        globalsize : int, None
+            Combined size of distributed array, if known.  Derived from
+            globalshape when not specified.
+        globalnbytes : int, None
+            Combined number of bytes of distributed array, if known.  Derived
+            from globalsize when not specified.
 
         Returns
         -------
@@ -53,20 +66,35 @@ class MPIArray(np.ndarray):
         return obj
 
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, local_array, comm=MPI.COMM_WORLD, comm_dims=None,
+                 comm_coord=None, local_to_global=None, globalshape=None,
+                 globalsize=None, globalnbytes=None):
         #Initialize unique properties
         self._globalshape = None
         self._globalsize = None
         self._globalnbytes = None
         self._globalndim = None
 
+        #Global properties known ahead of time don't require communication
+        if globalshape is not None:
+            self._globalshape = tuple(int(axis_len) for axis_len in globalshape)
+            self._globalndim = len(self._globalshape)
+            if globalsize is None:
+                globalsize = int(np.prod(self._globalshape))
+        if globalsize is not None:
+            self._globalsize = int(globalsize)
+            if globalnbytes is None:
+                globalnbytes = self._globalsize * self.itemsize
+        if globalnbytes is not None:
+            self._globalnbytes = int(globalnbytes)
+
 
     def __array_finalize__(self, obj):
         if obj is None: return
         self.comm = getattr(obj, 'comm', None)
         self.comm_dims = getattr(obj, 'comm_dims', None)
         self.comm_coord = getattr(obj, 'comm_coord', None)
-        self.local_to_global = getattr(obj, 'local_to_global', None)
+        self._l2g = getattr(obj, '_l2g', None)
         self._globalshape = getattr(obj, '_globalshape', None)
         self._globalsize = getattr(obj, '_globalsize', None)
         self._globalnbytes = getattr(obj, '_globalnbytes', None)
@@ -160,6 +188,41 @@ class MPIArray(np.ndarray):
         raise NotImplementedError("Define a globalndim implmentation")
 
 
+    @property
+    def local_to_global(self):
+        """ Global index start/end of local data by axis.
+
+        Returns
+        -------
+        local_to_global : dict, None
+            Format:
+                key, value = axis, [inclusive start, exclusive end)
+                {0: (start_index, end_index),
+                 1: (start_index, end_index),
+                 ...}
+            Notes:
+                Built from contiguous int64 array of shape (ndim, 2),
+                accessible through MPIArray._l2g, on each access.
+        """
+        if self._l2g is None:
+            return None
+        return {axis: (int(start), int(end))
+                for axis, (start, end) in enumerate(self._l2g.tolist())}
+
+
+    @local_to_global.setter
+    def local_to_global(self, local_to_global):
+        if local_to_global is None:
+            self._l2g = None
+        elif isinstance(local_to_global, dict):
+            self._l2g = np.asarray([local_to_global[axis]
+                                    for axis in sorted(local_to_global)],
+                                   dtype=np.int64).reshape(-1, 2)
+        else:
+            self._l2g = \
+                np.asarray(local_to_global, dtype=np.int64).reshape(-1, 2)
+
+
     @property
     def local(self):
         """ Base ndarray object local to each process.
@@ -235,6 +298,24 @@ class MPIArray(np.ndarray):
         raise NotImplementedError("Implement a custom min method")
 
 
+    def minmax(self, **kwargs):
+        """ Min and max of array elements in distributed matrix over a
+        given axis, determined together.
+
+        Parameters
+        ----------
+        axis : None or int
+            Axis or axes along which the min and max are performed.
+
+        Returns
+        -------
+        (MPIArray, MPIArray) : tuple of numpy.ndarray sub classes
+            MPIArrays with min and max values along specified axis with
+            replicated(copies on all procs) distribution.
+        """
+        raise NotImplementedError("Implement a custom minmax method")
+
+
     def std(self, **kwargs):
         """ Standard deviation of array elements in distributed matrix
         over a given axis.
@@ -318,7 +399,8 @@ class MPIArray(np.ndarray):
                               comm=self.comm,
                               comm_dims=self.comm_dims,
                               comm_coord=self.comm_coord,
-                              local_to_global=self.local_to_global)
+                              local_to_global=self.local_to_global,
+                              globalshape=self.globalshape)
 
 
     def collect_data(self):
@@ -0,0 +1,97 @@
+import os
+import numpy as np
+
+__all__ = ['local_reduction']
+
+#Environment variable opting in to thread parallel local reductions, its value
+## being the number of threads per process. Disabled by default, as the usual
+## process per core MPI layout leaves no cores for additional threads.
+_THREADS_ENV_VAR = 'MPIDS_LOCAL_THREADS'
+#Minimum number of local elements before thread parallel kernels are used,
+## below which numpy's single threaded reductions are faster
+_PARALLEL_THRESHOLD = 1 << 16
+#Number of elements reduced by each thread parallel task
+_CHUNK_SIZE = 1 << 14
+#Data types supported by thread parallel kernels
+_PARALLEL_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+def _local_cores():
+    #Cores process is bound to(e.g. by mpiexec), not all cores of the node
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _num_local_threads():
+    #Requested threads limited to process's own cores to avoid oversubscribing
+    requested = int(os.environ.get(_THREADS_ENV_VAR, 1))
+    return max(1, min(requested, _local_cores()))
+
+
+_PARALLEL_KERNELS = {}
+_NUM_THREADS = _num_local_threads()
+
+#Numba is optional and only imported when opted in, without it all local
+## reductions are performed by numpy
+njit = None
+if _NUM_THREADS > 1:
+    try:
+        import numba
+        from numba import njit, prange
+    except ImportError:
+        njit = None
+
+if njit is not None:
+    numba.set_num_threads(min(_NUM_THREADS, numba.config.NUMBA_NUM_THREADS))
+
+    #Reassociation lets each chunk's sum vectorize, NaN and inf handling are
+    ## unaffected as no other fast math flags are set. Cached so processes
+    ## only compile once per environment rather than on every run.
+    ## Max/min kernels are omitted, numpy's vectorized versions are faster.
+    @njit(parallel=True, fastmath={'reassoc'}, cache=True)
+    def _parallel_sum(flat_data):
+        num_chunks = (flat_data.size + _CHUNK_SIZE - 1) // _CHUNK_SIZE
+        partials = np.empty(num_chunks, dtype=flat_data.dtype)
+        for chunk in prange(num_chunks):
+            partials[chunk] = \
+                flat_data[chunk * _CHUNK_SIZE:(chunk + 1) * _CHUNK_SIZE].sum()
+        return partials.sum()
+
+
+    _PARALLEL_KERNELS = {'sum': _parallel_sum}
+
+
+def local_reduction(local_data, method, **kwargs):
+    """ Reduce process local array data, using thread parallel kernels
+        for sums of large floating point arrays when opted in through the
+        MPIDS_LOCAL_THREADS environment variable and Numba is available.
+
+    Parameters
+    ----------
+    local_data : numpy.ndarray
+        Numpy array data local to process.
+    method : str
+        Name of numpy.ndarray reduction method.
+        Supported types:
+            'max', 'min', 'sum'
+    kwargs : dict
+        Keyword arguments of numpy.ndarray reduction method.
+        Notes:
+            Thread parallel kernels only used when reducing entire array,
+            i.e. no axis or dtype specified.
+
+    Returns
+    -------
+    local_result : numpy scalar, numpy.ndarray
+        Result of numpy.ndarray reduction method.
+    """
+    kernel = _PARALLEL_KERNELS.get(method)
+    if kernel is not None and \
+       local_data.size >= _PARALLEL_THRESHOLD and \
+       local_data.dtype in _PARALLEL_DTYPES and \
+       local_data.flags['C_CONTIGUOUS'] and \
+       all(value is None for value in kwargs.values()):
+        return local_data.dtype.type(kernel(local_data.reshape(-1)))
+
+    return getattr(local_data, method)(**kwargs)
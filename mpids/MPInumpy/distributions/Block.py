@@ -1,16 +1,69 @@
+from collections import OrderedDict
+from functools import lru_cache
 from mpi4py import MPI
 import numpy as np
+import string
 
 from mpids.MPInumpy.MPIArray import MPIArray
+from mpids.MPInumpy._local_reductions import local_reduction
 from mpids.MPInumpy.errors import NotSupportedError, ValueError
-from mpids.MPInumpy.utils import determine_redistribution_counts_from_shape, \
-                                 distribute_shape,                           \
+from mpids.MPInumpy.utils import determine_indexed_globalshape,              \
+                                 determine_redistribution_counts_from_shape, \
                                  format_indexed_result,                      \
-                                 global_to_local_key
+                                 get_block_owner,                            \
+                                 global_to_local_key, plan_distribution,     \
+                                 _ascending_row_key,                         \
+                                 _INTEGER_TYPES
 
-from mpids.MPInumpy.mpi_utils import all_gather_v, all_to_all_v
+from mpids.MPInumpy.mpi_utils import all_gather_v, all_to_all_v, \
+                                     _mpi_dtype, _scratch_buffer
 from mpids.MPInumpy.distributions.Replicated import Replicated
 
+#Maximum number of array dimensions supported by numpy(NPY_MAXDIMS),
+## 32 prior to numpy 2.0 which raised it to 64
+_MAX_NDIM = 64 if np.lib.NumpyVersion(np.__version__) >= '2.0.0' \
+            else np.core.multiarray.MAXDIMS
+
+#Global metadata layout exchanged by builtin SUM and MAX reductions
+## [shape[0], ndim, shape[1], ..., shape[ndim - 1], 0, ...]
+## Leading entries combined by SUM, remaining entries combined by MAX.
+_META_SUM_LEN = 1
+_META_LEN = _META_SUM_LEN + _MAX_NDIM
+
+@lru_cache(maxsize=None)
+def _mean_m2_op(dtype_char):
+    #Combine (count, mean, M2) statistics records with Chan et al.'s parallel
+    ## update, M2 being the sum of squared differences from the mean.
+    ## Each record sent as single datatype element so it is never segmented.
+    np_dtype = np.dtype(dtype_char)
+
+    def _mean_m2(in_buf, inout_buf, datatype):
+        local_stats = np.frombuffer(in_buf, dtype=np_dtype).reshape(-1, 3)
+        global_stats = np.frombuffer(inout_buf, dtype=np_dtype).reshape(-1, 3)
+        local_count, local_mean, local_m2 = local_stats.T
+        global_count, global_mean, global_m2 = global_stats.T
+        count = local_count + global_count
+        delta = global_mean - local_mean
+        #Share of combined count held by inout records, none when empty
+        weight = np.divide(global_count, count,
+                           out=np.zeros_like(count), where=count > 0)
+        global_m2 += local_m2 + delta**2 * local_count * weight
+        global_mean[...] = local_mean + delta * weight
+        global_count[...] = count
+
+    record_mpi_dtype = _mpi_dtype(dtype_char).Create_contiguous(3).Commit()
+    return MPI.Op.Create(_mean_m2, commute=True), record_mpi_dtype
+
+def _sum_square_subscripts(ndim, axis):
+    #einsum subscripts for sum of elementwise squares along axis(all if None)
+    indices = string.ascii_letters[:ndim]
+    output = '' if axis is None else indices[:axis] + indices[axis + 1:]
+    return '{0},{0}->{1}'.format(indices, output)
+
+#Cached reshape redistribution plans, least recently used evicted first
+## Format: {(current_shape, desired_shape, dist, size, rank) : plan}
+_reshape_plans = OrderedDict()
+_MAX_RESHAPE_PLANS = 128
 
 """
     Block implementation of MPIArray abstract base class.
@@ -18,20 +71,65 @@ from mpids.MPInumpy.distributions.Replicated import Replicated
 class Block(MPIArray):
 
     def __getitem__(self, key):
+        #Descending rows are held by processes in reverse rank order,
+        ## select rows ascending and reverse the collected result instead
+        ascending_key = _ascending_row_key(key, self.globalshape)
+        if ascending_key is not None:
+            ascending_result = np.asarray(self.__getitem__(ascending_key))
+            return Replicated(np.ascontiguousarray(ascending_result[::-1]),
+                              comm=self.comm)
+
         local_key = global_to_local_key(key,
                                         self.globalshape,
-                                        self.local_to_global)
+                                        self._l2g)
         indexed_result = self.base.__getitem__(local_key)
         indexed_result = format_indexed_result(key, indexed_result)
-
-        distributed_result =  self.__class__(np.copy(indexed_result),
+        indexed_globalshape = determine_indexed_globalshape(key,
+                                                            self.globalshape)
+        #Result held entirely by one process only needs broadcasting
+        owner = self.__indexed_result_owner(key)
+        if owner is not None:
+            return self.__broadcast_indexed_result(indexed_result,
+                                                   indexed_globalshape,
+                                                   owner)
+        #Only strided views of local data need a contiguous copy
+        if not indexed_result.flags['C_CONTIGUOUS']:
+            indexed_result = np.ascontiguousarray(indexed_result)
+
+        distributed_result =  self.__class__(indexed_result,
                                              comm=self.comm,
                                              comm_dims=self.comm_dims,
-                                             comm_coord=self.comm_coord)
+                                             comm_coord=self.comm_coord,
+                                             globalshape=indexed_globalshape)
         #Return replicated copy of data
         return distributed_result.collect_data()
 
 
+    def __indexed_result_owner(self, key):
+        #Only known without communication for arrays distributed by
+        ## get_block_index along rows of 1-D process grid
+        if self.comm.Get_size() == 1 or self._l2g is None or \
+           self.comm_dims is None or len(self.comm_dims) != 1:
+            return None
+        row_key = key[0] if isinstance(key, tuple) and len(key) > 0 else key
+        if not isinstance(row_key, _INTEGER_TYPES):
+            return None
+        #Key already bounds checked by global_to_local_key
+        if row_key < 0:
+            row_key += self.globalshape[0]
+        return get_block_owner(row_key, self.globalshape[0], self.comm_dims[0])
+
+
+    def __broadcast_indexed_result(self, indexed_result, indexed_globalshape,
+                                   owner):
+        global_result = np.empty(indexed_globalshape, dtype=self.dtype)
+        if self.comm.Get_rank() == owner:
+            global_result[...] = indexed_result.reshape(indexed_globalshape)
+        self.comm.Bcast([global_result, _mpi_dtype(global_result.dtype.char)],
+                        root=owner)
+        return Replicated(global_result, comm=self.comm)
+
+
     def __setitem__(self, key, value):
         #Check input, will throw np.ValueError if data type of passed
         ## value can't be converted to objects type
@@ -45,7 +143,7 @@ class Block(MPIArray):
 
         local_key = global_to_local_key(key,
                                         self.globalshape,
-                                        self.local_to_global)
+                                        self._l2g)
         self.base.__setitem__(local_key, np_value)
 
 
@@ -58,73 +156,76 @@ class Block(MPIArray):
     @property
     def globalshape(self):
         if self._globalshape is None:
-            self.__globalshape()
+            self.__global_metadata()
         return self._globalshape
 
-    def __globalshape(self):
-        local_ndim = np.asarray(self.ndim, dtype=np.int32)
-        max_ndim = np.empty(1, dtype=np.int32)
-        self.comm.Allreduce(local_ndim, max_ndim, op=MPI.MAX)
-        #Pad local shape with zeros until it matches the global maximum ndim
-        padded_shape = np.pad(self.shape,
-                              (0, max_ndim[0] - local_ndim),
-                              mode='constant')
-
-        comm_shape = []
-        for axis in range(max_ndim[0]):
-            #Leading partition
-            if axis == 0:
-                axis_len = self.__custom_reduction(MPI.SUM,
-                                                   np.asarray(padded_shape[axis]))
-            else:
-                #Max necessary for resolving empty slicing
-                axis_len = self.__custom_reduction(MPI.MAX,
-                                                   np.asarray(padded_shape[axis]))
-
-            comm_shape.append(int(axis_len[0]))
-
-        self._globalshape = tuple(comm_shape)
-
 
     @property
     def globalsize(self):
         if self._globalsize is None:
-            self.__globalsize()
+            self.__global_metadata()
         return self._globalsize
 
-    def __globalsize(self):
-        comm_size = np.empty(1, dtype=np.int64)
-        self.comm.Allreduce(np.array(self.size), comm_size, op=MPI.SUM)
-        self._globalsize = int(comm_size)
-
 
     @property
     def globalnbytes(self):
         if self._globalnbytes is None:
-            self.__globalnbytes()
+            self.__global_metadata()
         return self._globalnbytes
 
-    def __globalnbytes(self):
-        comm_nbytes = np.empty(1, dtype=np.int64)
-        self.comm.Allreduce(np.array(self.nbytes), comm_nbytes, op=MPI.SUM)
-        self._globalnbytes = int(comm_nbytes)
-
 
     @property
     def globalndim(self):
         if self._globalndim is None:
-            self.__globalndim()
+            self.__global_metadata()
         return self._globalndim
 
-    def __globalndim(self):
-        self._globalndim = int(len(self.globalshape))
+    def __global_metadata(self):
+        #Single process, local metadata is the global metadata
+        if self.comm.Get_size() == 1:
+            self._globalshape = self.shape
+            self._globalsize = self.size
+            self._globalnbytes = self.nbytes
+            self._globalndim = self.ndim
+            return
+
+        #Leading axis length summed, ndim and trailing axis lengths maxed.
+        ## Max necessary for resolving empty slicing. Builtin operations
+        ## outperform a single reduction with a Python user defined operation.
+        #Pad local shape with zeros to fixed length so counts match on all ranks
+        local_meta = _scratch_buffer('local_meta', _META_LEN, np.int64)
+        local_meta[:] = 0
+        local_meta[0] = self.shape[0] if self.ndim > 0 else 0
+        local_meta[_META_SUM_LEN] = self.ndim
+        local_meta[_META_SUM_LEN + 1:_META_SUM_LEN + self.ndim] = self.shape[1:]
+        global_meta = _scratch_buffer('global_meta', _META_LEN, np.int64)
+
+        self.comm.Allreduce([local_meta[:_META_SUM_LEN], MPI.INT64_T],
+                            [global_meta[:_META_SUM_LEN], MPI.INT64_T],
+                            op=MPI.SUM)
+        self.comm.Allreduce([local_meta[_META_SUM_LEN:], MPI.INT64_T],
+                            [global_meta[_META_SUM_LEN:], MPI.INT64_T],
+                            op=MPI.MAX)
+
+        max_ndim = int(global_meta[_META_SUM_LEN])
+        if max_ndim > 0:
+            self._globalshape = \
+                (int(global_meta[0]),) + \
+                tuple(int(axis_len) for axis_len in
+                      global_meta[_META_SUM_LEN + 1:_META_SUM_LEN + max_ndim])
+        else:
+            self._globalshape = ()
+        #Size and nbytes follow from shape, no need to reduce them
+        self._globalsize = int(np.prod(self._globalshape))
+        self._globalnbytes = self._globalsize * self.itemsize
+        self._globalndim = max_ndim
 
 
     #Custom reduction method implementations
     def max(self, **kwargs):
         self.check_reduction_parms(**kwargs)
         axis = kwargs.get('axis')
-        local_max = np.asarray(self.base.max(**kwargs))
+        local_max = np.asarray(local_reduction(self.base, 'max', **kwargs))
         global_max = self.__custom_reduction(MPI.MAX, local_max, **kwargs)
         if self.globalndim > 2 and axis is not None:
             global_max = \
@@ -146,7 +247,7 @@ class Block(MPIArray):
     def min(self, **kwargs):
         self.check_reduction_parms(**kwargs)
         axis = kwargs.get('axis')
-        local_min = np.asarray(self.base.min(**kwargs))
+        local_min = np.asarray(local_reduction(self.base, 'min', **kwargs))
         global_min = self.__custom_reduction(MPI.MIN, local_min, **kwargs)
         if self.globalndim > 2 and axis is not None:
             global_min = \
@@ -154,9 +255,31 @@ class Block(MPIArray):
         return Replicated(global_min, comm=self.comm)
 
 
-    def std(self, **kwargs):
-        local_mean = self.mean(**kwargs)
+    def minmax(self, **kwargs):
+        self.check_reduction_parms(**kwargs)
+        axis = kwargs.get('axis')
+        local_min = np.asarray(local_reduction(self.base, 'min', **kwargs))
+        local_max = np.asarray(local_reduction(self.base, 'max', **kwargs))
+        if axis is None or axis == 0:
+            global_min, global_max = \
+                self.__minmax_reduction(local_min, local_max)
+        else:
+            #Local min and max paired along trailing axis, gathered together
+            local_minmax = np.stack([local_min, local_max], axis=-1)
+            global_minmax = all_gather_v(local_minmax, comm=self.comm)
+            global_min, global_max = \
+                np.ascontiguousarray(global_minmax.reshape(-1, 2).T)
+        if self.globalndim > 2 and axis is not None:
+            global_min = \
+                self.__higher_dimension_reduction_reshape(global_min, axis)
+            global_max = \
+                self.__higher_dimension_reduction_reshape(global_max, axis)
+        return (Replicated(global_min, comm=self.comm),
+                Replicated(global_max, comm=self.comm))
+
 
+    def std(self, **kwargs):
+        self.check_reduction_parms(**kwargs)
         axis = kwargs.get('axis')
 #TODO: Need to revisit for higher dim
         if axis is not None and self.globalndim > 3 and axis > 1:
@@ -164,24 +287,39 @@ class Block(MPIArray):
             "axis 0 and 1 only currently supported for 4+ dimensional matrices.")
 
         if axis is not None and axis > 0:
-            block_min, block_max = self.local_to_global[0]
-            local_mean = local_mean[block_min: block_max]
-            if self.globalndim - 1 == axis:
-                #Force a transpose
-                local_mean = local_mean.reshape(-1, 1)
-
-        local_square_diff = (self - local_mean)**2
-        local_sum_square_diff = np.asarray(local_square_diff.base.sum(**kwargs))
-        global_sum_square_diff = \
-            self.__custom_reduction(MPI.SUM,
-                                    local_sum_square_diff,
-                                    dtype=local_sum_square_diff.dtype,
-                                    **kwargs)
-        if axis is not None:
-            global_std = \
-                np.sqrt(global_sum_square_diff * 1. / self.globalshape[axis])
+            #Reduction along non-distributed axis requires no global mean
+            local_std = np.asarray(self.base.std(**kwargs))
+            global_std = self.__custom_reduction(MPI.SUM, local_std, **kwargs)
         else:
-            global_std = np.sqrt(global_sum_square_diff * 1. / self.globalsize)
+            dtype = kwargs.get('dtype')
+            if dtype is None:
+                dtype = self.dtype \
+                    if np.issubdtype(self.dtype, np.inexact) else np.float64
+            #Local two pass statistics in at least double precision, combined
+            ## across processes by single reduction of (count, mean, M2)
+            acc_dtype = np.promote_types(dtype, np.float64)
+            local_count = self.size if axis is None else self.shape[0]
+            reduced_shape = () if axis is None else self.shape[1:]
+            local_stats = np.zeros(reduced_shape + (3,), dtype=acc_dtype)
+            if local_count > 0:
+                local_mean = np.mean(self.base, axis=axis, dtype=acc_dtype)
+                local_diff = np.subtract(self.base, local_mean, dtype=acc_dtype)
+                #Sum of squares contracted directly, no squared temporary
+                local_stats[..., 0] = local_count
+                local_stats[..., 1] = local_mean
+                local_stats[..., 2] = np.einsum(
+                    _sum_square_subscripts(local_diff.ndim, axis),
+                    local_diff, local_diff)
+            global_stats = local_stats.reshape(-1, 3)
+            mean_m2_op, record_mpi_dtype = _mean_m2_op(global_stats.dtype.char)
+            if self.comm.Get_size() > 1:
+                self.comm.Allreduce(MPI.IN_PLACE,
+                                    [global_stats, record_mpi_dtype],
+                                    op=mean_m2_op)
+            num_elements = \
+                self.globalshape[axis] if axis is not None else self.globalsize
+            global_std = \
+                np.sqrt(global_stats[:, 2] / num_elements).astype(dtype)
 
         if self.globalndim > 2 and axis is not None:
             global_std = \
@@ -193,7 +331,7 @@ class Block(MPIArray):
     def sum(self, **kwargs):
         self.check_reduction_parms(**kwargs)
         axis = kwargs.get('axis')
-        local_sum = np.asarray(self.base.sum(**kwargs))
+        local_sum = np.asarray(local_reduction(self.base, 'sum', **kwargs))
         global_sum = self.__custom_reduction(MPI.SUM, local_sum, **kwargs)
         if self.globalndim > 2 and axis is not None:
             global_sum = \
@@ -203,46 +341,130 @@ class Block(MPIArray):
 
     def __custom_reduction(self, operation, local_red, axis=None, dtype=None,
                            out=None):
-        if dtype is None: dtype = local_red.dtype
+        #Contiguous buffers with explicit datatype avoid mpi4py type inference
+        ## only convert when necessary, common case is already suitable
+        if (dtype is not None and local_red.dtype != dtype) or \
+           not local_red.flags['C_CONTIGUOUS']:
+            local_red = np.ascontiguousarray(local_red, dtype=dtype)
+
+        #Single process, local result is the global result
+        if self.comm.Get_size() == 1:
+            return local_red.reshape(local_red.size)
 
         if axis is None or axis == 0:
-            global_red = np.empty(local_red.size, dtype=dtype)
-            self.comm.Allreduce(local_red, global_red, op=operation)
+            #Local result is reduced in place, no separate receive buffer
+            global_red = local_red.reshape(local_red.size)
+            mpi_dtype = _mpi_dtype(global_red.dtype.char)
+            self.comm.Allreduce(MPI.IN_PLACE,
+                                [global_red, mpi_dtype],
+                                op=operation)
         else:
             global_red = all_gather_v(local_red, comm=self.comm)
 
         return global_red
 
 
+    def __minmax_reduction(self, local_min, local_max):
+        #Minimums and order reversed maximums resolved by single builtin MIN
+        ## reduction, bitwise inversion reverses integer order without overflow
+        global_minmax = np.concatenate([local_min.reshape(local_min.size),
+                                        local_max.reshape(local_max.size)])
+        global_min = global_minmax[:local_min.size]
+        global_max = global_minmax[local_min.size:]
+        if self.comm.Get_size() == 1:
+            return global_min, global_max
+
+        mpi_dtype = _mpi_dtype(global_minmax.dtype.char)
+        if global_minmax.dtype.kind in 'iuf':
+            reverse = np.negative \
+                if global_minmax.dtype.kind == 'f' else np.invert
+            reverse(global_max, out=global_max)
+            self.comm.Allreduce(MPI.IN_PLACE,
+                                [global_minmax, mpi_dtype],
+                                op=MPI.MIN)
+            reverse(global_max, out=global_max)
+        else:
+            #MPI MIN/MAX undefined for booleans, logical AND/OR equivalent
+            min_op, max_op = (MPI.LAND, MPI.LOR) \
+                if global_minmax.dtype.kind == 'b' else (MPI.MIN, MPI.MAX)
+            self.comm.Allreduce(MPI.IN_PLACE,
+                                [global_min, mpi_dtype],
+                                op=min_op)
+            self.comm.Allreduce(MPI.IN_PLACE,
+                                [global_max, mpi_dtype],
+                                op=max_op)
+        return global_min, global_max
+
+
     def __higher_dimension_reduction_reshape(self, global_reduction, axis):
         reduced_shape = np.delete(np.asarray(self.globalshape), axis)
         return global_reduction.reshape(reduced_shape)
 
 
     def collect_data(self):
+        #Single process, data is already local
+        if self.comm.Get_size() == 1:
+            return Replicated(np.array(self), comm=self.comm)
+
         global_data = all_gather_v(self, shape=self.globalshape, comm=self.comm)
         return Replicated(global_data, comm=self.comm)
 
 
     def reshape(self, *args):
+        #Accept both reshape(a, b, ...) and reshape((a, b, ...))
+        if len(args) == 1 and isinstance(args[0], (tuple, list)):
+            args = tuple(args[0])
         if np.prod(args) != self.globalsize:
             raise ValueError("cannot reshape global array of size",
                              self.globalsize,"into shape", tuple(args))
 
-        local_shape, comm_dims, comm_coord, local_to_global = \
-            distribute_shape(args, self.dist, comm=self.comm)
+        local_shape, comm_dims, comm_coord, local_to_global, \
+            send_counts, recv_counts = \
+                _get_reshape_plan(self.globalshape, args, self.dist, self.comm)
 
-        send_counts, recv_counts = \
-            determine_redistribution_counts_from_shape(self.globalshape,
-                                                       args,
-                                                       self.dist,
-                                                       comm=self.comm)
         # Get new local data from personalized data exchange
+        ## received buffer is freshly allocated, no need to copy
         local_data = all_to_all_v(self, send_counts, recv_counts,
                                   recv_shape=local_shape, comm=self.comm)
 
-        return self.__class__(np.copy(local_data),
+        return self.__class__(local_data,
                               comm=self.comm,
-                              comm_dims=comm_dims,
-                              comm_coord=comm_coord,
-                              local_to_global=local_to_global)
+                              comm_dims=list(comm_dims),
+                              comm_coord=list(comm_coord),
+                              local_to_global=local_to_global,
+                              globalshape=args)
+
+
+def _get_reshape_plan(current_shape, desired_shape, dist, comm):
+    """ Helper method to determine(or fetch previously determined) local
+        layout and exchange counts necessary to reshape distributed array.
+        Plans only depend on the shapes and the process's position in the
+        communicator, and are determined without communication, so cache
+        hits/misses need not match across processes.
+    """
+    plan_key = (tuple(current_shape),
+                tuple(int(dim) for dim in desired_shape),
+                dist,
+                comm.Get_size(),
+                comm.Get_rank())
+    plan = _reshape_plans.get(plan_key)
+    if plan is not None:
+        _reshape_plans.move_to_end(plan_key)
+        return plan
+
+    #Desired shape known by all processes, no need to broadcast it
+    local_shape, comm_dims, comm_coord, local_to_global = \
+        plan_distribution(desired_shape, dist, comm.Get_size(), comm.Get_rank())
+
+    send_counts, recv_counts = \
+        determine_redistribution_counts_from_shape(current_shape,
+                                                   desired_shape,
+                                                   dist,
+                                                   comm=comm)
+
+    plan = (local_shape, comm_dims, comm_coord, local_to_global,
+            send_counts, recv_counts)
+    _reshape_plans[plan_key] = plan
+    if len(_reshape_plans) > _MAX_RESHAPE_PLANS:
+        _reshape_plans.popitem(last=False)
+    return plan
@@ -82,6 +82,14 @@ class Replicated(MPIArray):
                              comm=self.comm)
 
 
+    def minmax(self, **kwargs):
+        self.check_reduction_parms(**kwargs)
+        return (Replicated(np.asarray(self.base.min(**kwargs)),
+                              comm=self.comm),
+                Replicated(np.asarray(self.base.max(**kwargs)),
+                              comm=self.comm))
+
+
     def std(self, **kwargs):
         self.check_reduction_parms(**kwargs)
         return Replicated(np.asarray(self.base.std(**kwargs)),
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from mpi4py import MPI
 import numpy as np
 
@@ -7,6 +8,10 @@ __all__ = ['all_gather_v', 'all_to_all', 'all_to_all_v', 'broadcast_array',
            'broadcast_shape', 'get_comm', 'get_comm_size',
            'get_rank', 'scatter_v']
 
+#Persistent buffers for small collective metadata exchanges
+## Format: {(name, length, dtype char) : numpy.ndarray}
+_scratch_buffers = {}
+
 def all_gather_v(array_data, shape=None, comm=MPI.COMM_WORLD):
     """ Gather distributed array data to all processes
 
@@ -29,28 +34,32 @@ def all_gather_v(array_data, shape=None, comm=MPI.COMM_WORLD):
         raise TypeError('invalid data type for all_gather_v.')
 
     comm_size = comm.Get_size()
-    local_displacement = np.empty(1, dtype=np.int32)
-    displacements = np.empty(comm_size, dtype=np.int32)
-    local_count = np.asarray(array_data.size, dtype=np.int32)
-    counts = np.empty(comm_size, dtype=np.int32)
-    total_count = np.empty(1, dtype=np.int32)
-
-    #Exclusive scan to determine displacements
-    comm.Exscan(local_count, local_displacement, op=MPI.SUM)
-    comm.Allreduce(local_count, total_count, op=MPI.SUM)
-    comm.Allgather(local_displacement, displacements)
-    comm.Allgather(local_count, counts)
+    local_count = _scratch_buffer('local_count', 1, np.int32)
+    local_count[0] = array_data.size
+    counts = _scratch_buffer('counts', comm_size, np.int32)
+
+    #Displacements and total derived locally from collected counts
+    comm.Allgather([local_count, MPI.INT32_T], [counts, MPI.INT32_T])
+    displacements = _scratch_buffer('displacements', comm_size, np.int32)
+    displacements[0] = 0
+    np.cumsum(counts[:-1], out=displacements[1:])
+    total_count = int(counts.sum())
 
     gathered_array = np.empty(total_count, dtype=array_data.dtype)
+    #Place local data directly in its slot of the receive buffer
+    rank = comm.Get_rank()
+    local_start = displacements[rank]
+    local_end = local_start + counts[rank]
+    gathered_array[local_start:local_end].reshape(array_data.shape)[...] = \
+        array_data
+
+    mpi_dtype = _mpi_dtype(array_data.dtype.char)
+    comm.Allgatherv(MPI.IN_PLACE,
+                    [gathered_array, (counts, displacements), mpi_dtype])
+
     #Reshape if necessary
     if shape is not None:
         gathered_array = gathered_array.reshape(shape)
-    # Final conditioning of displacements list
-    displacements[0] = 0
-
-    mpi_dtype = MPI._typedict[np.sctype2char(array_data.dtype)]
-    comm.Allgatherv(array_data,
-                    [gathered_array, (counts, displacements), mpi_dtype])
 
     return gathered_array
 
@@ -183,7 +192,7 @@ def all_to_all_v(array_data, send_counts, recv_counts, send_displacements=None,
         recv_displacements = _displacments_from_counts(recv_counts)
 
     recv_local_array = np.empty(recv_counts.sum(), dtype=array_data.dtype)
-    mpi_dtype = MPI._typedict[np.sctype2char(array_data.dtype)]
+    mpi_dtype = _mpi_dtype(array_data.dtype.char)
     comm.Alltoallv(
         [array_data, (send_counts, send_displacements), mpi_dtype],
         [recv_local_array, (recv_counts, recv_displacements), mpi_dtype])
@@ -221,6 +230,24 @@ def _displacments_from_counts(counts):
     displacements[0] = 0
     return displacements
 
+
+@lru_cache(maxsize=None)
+def _mpi_dtype(dtype_char):
+    """ Helper method to memoize lookup of MPI datatype for numpy type
+        character code.
+
+        Parameters
+        ----------
+        dtype_char : str
+            Numpy data type character code, i.e. numpy.dtype.char
+
+        Returns
+        -------
+        mpi_dtype : MPI.Datatype
+            Equivalent MPI datatype.
+    """
+    return MPI._typedict[dtype_char]
+
 #TODO find elegant way to handle type checking in this
 def broadcast_array(array_data, comm=MPI.COMM_WORLD, root=0):
     """ Broadcast array to all processes
@@ -246,20 +273,75 @@ def broadcast_array(array_data, comm=MPI.COMM_WORLD, root=0):
     array_shape = array_data.shape if rank == root else None
     array_shape = broadcast_shape(array_shape, comm=comm, root=root)
 
-#TODO: Look into str/char buffer send for this operation
-    array_dtype = np.sctype2char(array_data.dtype) if rank == root else None
-    array_dtype = comm.bcast(array_dtype, root=root)
+    array_dtype = _broadcast_dtype_char(array_data, comm=comm, root=root)
 
     #Create empty buffer on non-root ranks
     if rank != root:
         array_data = np.empty(array_shape, dtype=np.dtype(array_dtype))
+    elif not array_data.flags['C_CONTIGUOUS']:
+        #Only copy when necessary, ascontiguousarray would also promote
+        ## 0-d arrays to shape (1,) while other ranks hold shape ()
+        array_data = np.ascontiguousarray(array_data)
 
     #Broadcast the array
-    mpi_dtype = MPI._typedict[array_dtype]
+    mpi_dtype = _mpi_dtype(array_dtype)
     comm.Bcast([array_data, array_data.size, mpi_dtype], root=root)
 
     return array_data
 
+
+def _scratch_buffer(name, length, dtype):
+    """ Helper method to fetch a persistent buffer for collective metadata,
+        avoiding allocations on each call.
+        Note: Contents are only valid until the next fetch of the same
+        name/length/dtype, buffers should never be returned to callers.
+
+        Parameters
+        ----------
+        name : str
+            Identifier for intended use of buffer.
+        length : int
+            Number of elements in buffer.
+        dtype : data-type
+            Data type of buffer.
+
+        Returns
+        -------
+        buffer : numpy.ndarray
+            Uninitialized(or previously used) buffer.
+    """
+    key = (name, length, np.dtype(dtype).char)
+    buffer = _scratch_buffers.get(key)
+    if buffer is None:
+        buffer = _scratch_buffers[key] = np.empty(length, dtype=dtype)
+    return buffer
+
+
+def _broadcast_dtype_char(array_data, comm=MPI.COMM_WORLD, root=0):
+    """ Helper method to broadcast data type character code of root
+        process array data using a buffer(non-pickled) broadcast.
+
+        Parameters
+        ----------
+        array_data : numpy.ndarray
+            Numpy array data local to root process.
+        comm : MPI Communicator, optional
+            See broadcast_array docstring
+        root : int, optional
+            See broadcast_array docstring
+
+        Returns
+        -------
+        array_dtype : str
+            Character code of root process array data type.
+    """
+    dtype_char = np.empty(1, dtype='S1')
+    if comm.Get_rank() == root:
+        dtype_char[0] = array_data.dtype.char
+    comm.Bcast([dtype_char, MPI.CHAR], root=root)
+
+    return dtype_char[0].decode()
+
 #TODO find elegant way to handle type checking in this
 def broadcast_shape(shape, comm=MPI.COMM_WORLD, root=0):
     """ Broadcast shape to all processes
@@ -283,17 +365,17 @@ def broadcast_shape(shape, comm=MPI.COMM_WORLD, root=0):
     rank = comm.Get_rank()
     #Transmit number of dimensions
     if rank == root:
-        shape_ndim = np.asarray(len(shape), dtype=np.int32)
+        shape_ndim = np.array([len(shape)], dtype=np.int32)
     else:
         shape_ndim = np.empty(1, dtype=np.int32)
-    comm.Bcast(shape_ndim, root=root)
+    comm.Bcast([shape_ndim, MPI.INT32_T], root=root)
 
     #Transmit shape values
     if rank == root:
-        array_shape = np.asarray(shape, dtype=np.int32)
+        array_shape = np.ascontiguousarray(shape, dtype=np.int32)
     else:
-        array_shape = np.empty(shape_ndim, dtype=np.int32)
-    comm.Bcast(array_shape, root=root)
+        array_shape = np.empty(shape_ndim[0], dtype=np.int32)
+    comm.Bcast([array_shape, MPI.INT32_T], root=root)
 
     return array_shape
 
@@ -400,15 +482,13 @@ def scatter_v(array_data, displacements, shapes, comm=MPI.COMM_WORLD, root=0):
     displacements = broadcast_array(displacements, root=root)
     shapes = broadcast_array(shapes, root=root)
 
-#TODO: Look into str/char buffer send for this operation
-    array_dtype = np.sctype2char(array_data.dtype) if rank == root else None
-    array_dtype = comm.bcast(array_dtype, root=root)
+    array_dtype = _broadcast_dtype_char(array_data, comm=comm, root=root)
 
     counts = [np.prod(shape) for shape in shapes]
     local_data = np.empty(shapes[rank], dtype=np.dtype(array_dtype))
 
     #Scatter the array
-    mpi_dtype = MPI._typedict[array_dtype]
+    mpi_dtype = _mpi_dtype(array_dtype)
     comm.Scatterv([array_data, counts, displacements, mpi_dtype],
                   local_data, root=root)
 
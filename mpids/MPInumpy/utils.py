@@ -1,22 +1,36 @@
+from functools import lru_cache
 from mpi4py import MPI
 import numpy as np
 
 from mpids.MPInumpy.errors import InvalidDistributionError,  NotSupportedError
 from mpids.MPInumpy.mpi_utils import all_gather_v,                \
-                                     all_to_all,                  \
                                      broadcast_array,             \
                                      broadcast_shape,             \
                                      get_comm_size, get_rank,     \
                                      scatter_v
 
-__all__ = ['determine_local_shape_and_mapping',
+__all__ = ['determine_indexed_globalshape',
+           'determine_local_shape_and_mapping',
            'determine_redistribution_counts_from_shape',
            'determine_global_offset', 'distribute_array', 'distribute_range',
-           'distribute_shape', 'get_block_index', 'get_cart_coords',
+           'distribute_shape', 'get_block_index', 'get_block_indices_all',
+           'get_block_owner', 'get_cart_coords',
            'get_comm_dims', 'global_to_local_key', 'distribution_to_dimensions',
-           'is_Replicated', 'is_block_distributed',
+           'is_Replicated', 'is_block_distributed', 'plan_distribution',
            'slice_local_data_and_determine_mapping']
 
+#Python and numpy scalar integer types accepted as index keys
+_INTEGER_TYPES = (int, np.integer)
+#Slice selecting an entire axis, which requires no translation
+_FULL_SLICE = slice(None)
+
+#Error messages, formatted only when raised
+_INVALID_DIST_MSG = 'Invalid distribution encountered: {}'
+_UNSUPPORTED_KEY_MSG = 'index/slice key {} is not supported'
+_OUT_OF_BOUNDS_MSG = \
+    'index {} is out of bounds for axis {} with global shape {}'
+_TOO_MANY_INDICES_MSG = 'too many indices for array with global shape {}'
+
 
 def determine_local_shape_and_mapping(array_shape, dist, comm_dims, comm_coord):
     """ Determine expected distributed local shape and global mapping based on
@@ -53,20 +67,25 @@ def determine_local_shape_and_mapping(array_shape, dist, comm_dims, comm_coord):
         local_to_global = None
         return array_shape, local_to_global
 
-    local_to_global = {}
-    local_shape = []
-    for axis, axis_length in enumerate(array_shape):
-        if axis == 0:
-            row_start, row_end = get_block_index(axis_length,
-                                                 comm_dims[0],
-                                                 comm_coord[0])
-            local_to_global[axis] = (int(row_start), int(row_end))
-            local_shape.append(row_end - row_start)
-        else:
-            local_to_global[axis] = (0, int(axis_length))
-            local_shape.append(axis_length)
+    if len(array_shape) == 0:
+        return (), {}
+
+    #Only leading axis is distributed, remaining axes are entirely local
+    row_start, row_end = get_block_index(array_shape[0],
+                                         comm_dims[0],
+                                         comm_coord[0])
+    local_to_global = _row_block_local_to_global(array_shape, row_start, row_end)
+    local_shape = (row_end - row_start,) + tuple(array_shape[1:])
+
+    return local_shape, local_to_global
 
-    return tuple(local_shape), local_to_global
+
+def _row_block_local_to_global(shape, row_start, row_end):
+    """ Helper method to build local_to_global of row block, remaining axes
+        spanning their entire global length """
+    return {0: (int(row_start), int(row_end)),
+            **{axis: (0, int(axis_length))
+               for axis, axis_length in enumerate(shape[1:], 1)}}
 
 
 def determine_global_offset(index, global_shape):
@@ -107,6 +126,43 @@ def determine_global_offset(index, global_shape):
     return int(global_offset)
 
 
+def determine_indexed_globalshape(global_key, globalshape):
+    """ Determine global shape of __getitem__ based result without
+        communicating with other processes.  Shapes are formatted to match
+        the results of format_indexed_result.
+
+    Parameters
+    ----------
+    global_key : int, slice, tuple
+        Selection indices, i.e. keys to object access dunder methods
+        __getitem__, __setitem__, ...
+    globalshape : tuple
+        Combined shape of distributed array.
+
+    Returns
+    -------
+    indexed_globalshape : tuple
+        Combined shape of distributed result of indexing with global_key.
+    """
+    #Zero stride view avoids allocating/touching global sized array
+    indexed_globalshape = \
+        np.broadcast_to(np.empty((), dtype=np.bool_), globalshape)[global_key].shape
+
+    #Avoid empty tuples for shape
+    if len(indexed_globalshape) == 0:
+        return (1,)
+
+    #Adjust shape when nothing sliced on any process
+    if np.prod(indexed_globalshape) == 0:
+        if isinstance(global_key, _INTEGER_TYPES) or \
+            (isinstance(global_key, tuple) and
+             all(isinstance(dim_key, _INTEGER_TYPES) for dim_key in global_key)):
+            return (0,)
+        return (0,) * len(indexed_globalshape)
+
+    return indexed_globalshape
+
+
 #TODO: Rethink the need for dist, it's practically irrevelant here
 def determine_redistribution_counts_from_shape(current_shape, desired_shape,
                                                dist, comm=MPI.COMM_WORLD):
@@ -152,48 +208,38 @@ def determine_redistribution_counts_from_shape(current_shape, desired_shape,
     current_offset = determine_global_offset(current_index, current_shape)
 
     desired_leading_dim = desired_shape[0]
-    #Distribute work of determining desired partitioning
-    desired_partitoning = \
-        np.array(get_block_index(desired_leading_dim, size, rank),
-                 dtype=np.int32)
-    #Collect global start/stops of rank based partitions
-    global_desired_partitoning = all_gather_v(desired_partitoning,
-                                             shape=(size, 2),
-                                             comm=comm)
+    #Global start/stops of rank based partitions, known without communication
+    desired_partition_starts, desired_partition_ends = \
+        get_block_indices_all(desired_leading_dim, size)
 
     current_over_paritioning = current_partition_end - current_partition_start
     current_remaining_dim = int(np.prod(current_shape[1:]) * current_over_paritioning)
     desired_remaining_dim = int(np.prod(desired_shape[1:]))
-    send_counts = np.zeros(size, dtype=np.int32)
-    for global_rank in range(size):
-        partition_start, partition_stop = global_desired_partitoning[global_rank]
-        partition_min = partition_start * desired_remaining_dim
-        partition_max = partition_stop * desired_remaining_dim
-
-        #Trying to reduce the number of iterations
-        if __is_offset_beyond_bounds(current_offset, current_remaining_dim,
-                                     partition_min, partition_max):
-            continue
-
-        for offset in range(current_offset, current_offset + current_remaining_dim):
-            if (offset >= partition_min and offset < partition_max):
-                send_counts[global_rank] += 1
-
-    #Use all to all to distribute what's being sent
-    recv_counts = all_to_all(send_counts, comm=comm)
+    partition_mins = desired_partition_starts * desired_remaining_dim
+    partition_maxs = desired_partition_ends * desired_remaining_dim
+
+    #Overlap of local global offsets with each rank's desired partition
+    overlap_starts = np.maximum(partition_mins, current_offset)
+    overlap_ends = \
+        np.minimum(partition_maxs, current_offset + current_remaining_dim)
+    send_counts = \
+        np.maximum(overlap_ends - overlap_starts, 0).astype(np.int32)
+
+    #Layouts of all processes are deterministic, so what each rank sends
+    ## here is determined locally as well, no all to all exchange necessary
+    current_partition_starts, current_partition_ends = \
+        get_block_indices_all(current_leading_dim, size)
+    current_row_len = int(np.prod(current_shape[1:]))
+    sender_mins = current_partition_starts * current_row_len
+    sender_maxs = current_partition_ends * current_row_len
+    overlap_starts = np.maximum(sender_mins, partition_mins[rank])
+    overlap_ends = np.minimum(sender_maxs, partition_maxs[rank])
+    recv_counts = \
+        np.maximum(overlap_ends - overlap_starts, 0).astype(np.int32)
 
     return send_counts, recv_counts
 
 
-def __is_offset_beyond_bounds(current_offset, current_remaining_dim,
-                              partition_min, partition_max):
-    """ Helper method to check if current global offset is outside bounds
-        of target repartiton.
-    """
-    return (current_offset > partition_max or
-        current_offset + current_remaining_dim < partition_min)
-
-
 def distribute_array(array_data, dist, comm=MPI.COMM_WORLD, root=0):
     """ Distribute global array like object among MPI processes base on
     specified distribution.
@@ -232,7 +278,9 @@ def distribute_array(array_data, dist, comm=MPI.COMM_WORLD, root=0):
              ...}
     """
     if is_Replicated(dist):
-        local_data = broadcast_array(np.asarray(array_data),
+        #Only root's data is broadcast, no need to convert it elsewhere
+        root_data = np.asarray(array_data) if comm.Get_rank() == root else None
+        local_data = broadcast_array(root_data,
                                      comm=comm,
                                      root=root)
         comm_dims = None
@@ -244,7 +292,12 @@ def distribute_array(array_data, dist, comm=MPI.COMM_WORLD, root=0):
 
         comm_dims = get_comm_dims(size, dist)
         comm_coord = get_cart_coords(comm_dims, size, rank)
-        array_shape = np.shape(array_data) if rank == root else None
+        #Only root's data is scattered, convert it once into the contiguous
+        ## buffer Scatterv requires, copying only non-contiguous arrays.
+        ## Unlike ascontiguousarray, require keeps 0-d data 0-d.
+        root_data = \
+            np.require(array_data, requirements='C') if rank == root else None
+        array_shape = root_data.shape if rank == root else None
         array_shape = broadcast_shape(array_shape, comm=comm, root=root)
 
         local_shape, local_to_global = \
@@ -259,7 +312,7 @@ def distribute_array(array_data, dist, comm=MPI.COMM_WORLD, root=0):
         displacements = np.roll(np.cumsum(np.prod(shapes, axis=1)),1)
         displacements[0] = 0
 
-        local_data = scatter_v(np.asarray(array_data),
+        local_data = scatter_v(root_data,
                                displacements,
                                shapes,
                                comm=comm,
@@ -377,17 +430,78 @@ def distribute_shape(shape, dist, comm=MPI.COMM_WORLD, root=0):
     size = comm.Get_size()
     rank = comm.Get_rank()
 
-    comm_dims = get_comm_dims(size, dist)
-    comm_coord = get_cart_coords(comm_dims, size, rank)
-
     array_shape = shape if rank == root else None
     array_shape = broadcast_shape(array_shape, comm=comm, root=root)
 
-    local_shape, local_to_global  = \
-        determine_local_shape_and_mapping(array_shape,
-                                          dist,
-                                          comm_dims,
-                                          comm_coord)
+    local_shape, comm_dims, comm_coord, local_to_global = \
+        plan_distribution(array_shape, dist, size, rank)
+
+    if is_Replicated(dist):
+        return local_shape, comm_dims, comm_coord, local_to_global
+    return local_shape, list(comm_dims), list(comm_coord), \
+           {axis: (start, end)
+            for axis, (start, end) in enumerate(local_to_global.tolist())}
+
+
+def plan_distribution(shape, dist, procs, rank):
+    """ Determine local layout of process(rank) for a global array shape
+        distributed among processes, without communication.
+
+    Parameters
+    ----------
+    shape : int, tuple of int
+        Global shape of data to distribute.
+    dist : str, list, tuple
+        Specified distribution of data among processes.
+        Default value 'b' : Block
+        Supported types:
+            'b' : Block
+            'r' : Replicated
+    procs: int
+        Size/number of processes in communicator
+    rank : int
+        Process rank in communicator
+
+    Returns
+    -------
+    local_shape : tuple
+        Local shape determined for process(rank)
+    comm_dims : tuple, None
+        Dimensions of cartesian grid
+    coordinates : tuple, None
+        Coordinates of rank in grid
+    local_to_global : numpy.ndarray, None
+        Read only int64 array of shape (ndim, 2) specifying global index
+        [inclusive start, exclusive end) of data by axis.
+    """
+    if isinstance(shape, _INTEGER_TYPES):
+        shape = (shape,)
+    return _plan_distribution(tuple(int(axis_len) for axis_len in shape),
+                              _hashable_distribution(dist),
+                              procs,
+                              rank)
+
+
+@lru_cache(maxsize=256)
+def _plan_distribution(shape, dist, procs, rank):
+    """ Helper method to determine, and memoize, plan_distribution """
+    if is_Replicated(dist):
+        return shape, None, None, None
+
+    comm_dims = _get_comm_dims(procs, dist)
+    comm_coord = _get_cart_coords(comm_dims, procs, rank)
+
+    local_to_global = np.zeros((len(shape), 2), dtype=np.int64)
+    local_shape = ()
+    if len(shape) > 0:
+        #Only leading axis is distributed, remaining axes are entirely local
+        row_start, row_end = get_block_index(shape[0],
+                                             comm_dims[0],
+                                             comm_coord[0])
+        local_to_global[0] = (row_start, row_end)
+        local_to_global[1:, 1] = shape[1:]
+        local_shape = (row_end - row_start,) + shape[1:]
+    local_to_global.flags.writeable = False
 
     return local_shape, comm_dims, comm_coord, local_to_global
 
@@ -412,10 +526,16 @@ def distribution_to_dimensions(distribution, procs):
         Seed for determinging processes per cartesian coordinate
         direction.
     """
+    return _distribution_to_dimensions(_hashable_distribution(distribution),
+                                       procs)
+
+
+@lru_cache(maxsize=128)
+def _distribution_to_dimensions(distribution, procs):
+    """ Helper method to determine, and memoize, distribution_to_dimensions """
     if is_block_distributed(distribution):
         return 1
-    raise InvalidDistributionError(
-        'Invalid distribution encountered: {}'.format(distribution))
+    raise InvalidDistributionError(_INVALID_DIST_MSG.format(distribution))
 
 
 def format_indexed_result(global_key, indexed_result):
@@ -441,26 +561,22 @@ def format_indexed_result(global_key, indexed_result):
         formatted_indexed_result : numpy.ndarray
             Original array with properties necessary for distribution
     """
-    #Avoid empty tuples for shape
-    if indexed_result.ndim == 0:
-        indexed_result = np.array([indexed_result])
+    #Avoid empty tuples for shape, views 0-d arrays rather than copying
+    indexed_result = np.atleast_1d(indexed_result)
 
     #Adjust shape for processes with nothing sliced
     if indexed_result.size == 0:
-        if isinstance(global_key, int):
-            indexed_result = indexed_result.reshape(0)
-        if isinstance(global_key, slice):
-            indexed_result = \
-                indexed_result.reshape([0] * len(indexed_result.shape))
-        if isinstance(global_key, tuple):
-            if all(isinstance(dim_key, int) for dim_key in global_key):
-                indexed_result = indexed_result.reshape(0)
-            else:
-                indexed_result = \
-                    indexed_result.reshape([0] * len(indexed_result.shape))
+        if isinstance(global_key, _INTEGER_TYPES) or \
+           (isinstance(global_key, tuple) and
+            all(isinstance(dim_key, _INTEGER_TYPES) for dim_key in global_key)):
+            return indexed_result.reshape(0)
+        return indexed_result.reshape((0,) * indexed_result.ndim)
     return indexed_result
 
 
+#Scalar index helpers are memoized rather than Numba compiled, per call
+## dispatch of a jitted function costs more than the pure Python arithmetic
+@lru_cache(maxsize=1024)
 def get_block_index(axis_len, axis_size, axis_coord):
     """ Get start/end array index range along axis for data block.
 
@@ -493,13 +609,72 @@ def get_block_index(axis_len, axis_size, axis_coord):
     return (start_index, end_index)
 
 
+def get_block_indices_all(axis_len, axis_size):
+    """ Get start/end array index ranges along axis for data blocks of all
+        processes, vectorized equivalent of get_block_index.
+
+    Parameters
+    ----------
+    axis_len : int
+        Length of array data along axis.
+    axis_size : int
+        Number of processes along axis.
+
+    Returns
+    -------
+    start_indices, end_indices : numpy.ndarray, numpy.ndarray
+        Inclusive start and exclusive end index along axis for data block,
+        indexed by cartesian coordinate along axis.
+    """
+    axis_coords = np.arange(axis_size)
+    axis_num, axis_rem = divmod(axis_len, axis_size)
+
+    extended = axis_coords < axis_rem
+    local_lens = np.where(extended, axis_num + 1, axis_num)
+    start_indices = \
+        np.where(extended,
+                 axis_coords * (axis_num + 1),
+                 axis_rem * (axis_num + 1) + (axis_coords - axis_rem) * axis_num)
+    end_indices = start_indices + local_lens
+
+    return start_indices, end_indices
+
+
+def get_block_owner(index, axis_len, axis_size):
+    """ Get cartesian coordinate along axis of data block containing index,
+        inverse of get_block_index.
+
+    Parameters
+    ----------
+    index : int
+        Non-negative array index along axis.
+    axis_len : int
+        Length of array data along axis.
+    axis_size : int
+        Number of processes along axis.
+
+    Returns
+    -------
+    axis_coord : int
+        Cartesian coordinate along axis of process owning index.
+    """
+    axis_num = axis_len // axis_size
+    axis_rem = axis_len % axis_size
+
+    #Leading blocks contain one extra element
+    extended_len = axis_rem * (axis_num + 1)
+    if index < extended_len:
+        return index // (axis_num + 1)
+    return axis_rem + (index - extended_len) // axis_num
+
+
 def get_cart_coords(comm_dims, procs, rank):
     """ Get coordinates of process placed on cartesian grid.
         Implementation based on OpenMPI.mca.topo.topo_base_cart_coords
 
     Parameters
     ----------
-    comm_dims : list
+    comm_dims : list, tuple
         Division of processes in cartesian grid
     procs: int
         Size/number of processes in communicator
@@ -514,15 +689,19 @@ def get_cart_coords(comm_dims, procs, rank):
     if comm_dims == None:
         return None
 
-    coordinates = []
-    rem_procs = procs
+    return list(_get_cart_coords(tuple(comm_dims), procs, rank))
 
-    for dim in comm_dims:
-        rem_procs = rem_procs // dim
-        coordinates.append(rank // rem_procs)
-        rank = rank % rem_procs
 
-    return coordinates
+@lru_cache(maxsize=1024)
+def _get_cart_coords(comm_dims, procs, rank):
+    """ Helper method to compute, and memoize, cartesian coordinates as tuple
+        for get_cart_coords """
+    dims = np.asarray(comm_dims, dtype=np.int64)
+    #Remaining processes after each dimension, i.e. row-major grid strides
+    rem_procs = procs // np.cumprod(dims)
+    coordinates = (rank // rem_procs) % dims
+
+    return tuple(coordinates.tolist())
 
 
 def get_comm_dims(procs, dist):
@@ -547,7 +726,22 @@ def get_comm_dims(procs, dist):
     """
     if is_Replicated(dist):
         return None
-    return MPI.Compute_dims(procs, distribution_to_dimensions(dist, procs))
+    return list(_get_comm_dims(procs, _hashable_distribution(dist)))
+
+
+@lru_cache(maxsize=128)
+def _get_comm_dims(procs, dist):
+    """ Helper method to compute, and memoize, cartesian grid dimensions as
+        tuple for get_comm_dims """
+    return tuple(MPI.Compute_dims(procs,
+                                  distribution_to_dimensions(dist, procs)))
+
+
+def _hashable_distribution(distribution):
+    """ Helper method to convert list distributions to cacheable tuples """
+    if isinstance(distribution, list):
+        return tuple(distribution)
+    return distribution
 
 
 def global_to_local_key(global_key, globalshape, local_to_global_dict):
@@ -556,55 +750,78 @@ def global_to_local_key(global_key, globalshape, local_to_global_dict):
 
     Parameters
     ----------
-    global_key : int, slice, tuple
+    global_key : int, numpy.integer, slice, tuple
         Selection indices, i.e. keys to object access dunder methods
         __getitem__, __setitem__, ...
     globalshape : tuple
         Combined shape of distributed array.
-    local_to_global_dict : dictionary
+    local_to_global_dict : dictionary, tuple, numpy.ndarray
         Dictionary specifying global index start/end of data by axis.
         Format:
             key, value = axis, (inclusive start, exclusive end)
             {0: [start_index, end_index),
              1: [start_index, end_index),
              ...}
+        Equivalent tuple of (start_index, end_index) pairs or numpy array
+        of shape (ndim, 2), indexed by axis, also accepted.
 
     Returns
     -------
     local_key : int, slice, tuple
         Selection indices present in locally distributed array.
     """
-    __global_to_local_key_map = {int   : _global_to_local_key_int,
-                                 slice : _global_to_local_key_slice,
-                                 tuple : _global_to_local_key_tuple}
-
-    def __unsupported_key(*args):
-        raise NotSupportedError('index/slice key ' +
-                                '{} '.format(global_key) +
-                                'is not supported')
-
-    local_key = __global_to_local_key_map\
-        .get(type(global_key), __unsupported_key)(global_key,
-                                                  globalshape,
-                                                  local_to_global_dict)
-    return local_key
+    #Boolean keys are masks in numpy, not indices
+    is_int_key = isinstance(global_key, _INTEGER_TYPES) and \
+                 not isinstance(global_key, bool)
+    if not (is_int_key or isinstance(global_key, (slice, tuple))):
+        raise NotSupportedError(_UNSUPPORTED_KEY_MSG.format(global_key))
 
+    #Undistributed keys only require validation
+    if local_to_global_dict is None:
+        if is_int_key:
+            _validate_int(global_key, globalshape[0], 0)
+        if isinstance(global_key, tuple):
+            _global_to_local_key_tuple(global_key, globalshape, None)
+        return global_key
 
-def _global_to_local_key_int(global_key, globalshape,
-                             local_to_global_dict, axis=0):
-    """ Helper method to process int keys """
+    if isinstance(global_key, slice):
+        return _global_to_local_key_slice(global_key,
+                                          globalshape,
+                                          local_to_global_dict,
+                                          0)
+    if is_int_key:
+        return _global_to_local_key_int(global_key,
+                                        globalshape,
+                                        local_to_global_dict,
+                                        0)
+    return _global_to_local_key_tuple(global_key,
+                                      globalshape,
+                                      local_to_global_dict)
+
+
+def _validate_int(global_key, axis_len, axis):
+    """ Helper method to bounds check int keys, returns non-negative key """
     # Handle negative/reverse access case
     if global_key < 0:
-        global_key += globalshape[axis]
-    if global_key < 0 or global_key >= globalshape[axis]:
-        raise IndexError('index {}'.format(global_key) +
-                         ' is out of bounds for axis 0 with' +
-                         ' global shape {}'.format(globalshape[axis]))
-    if local_to_global_dict is None:
-        return global_key
+        global_key += axis_len
+    if not 0 <= global_key < axis_len:
+        _raise_idx(global_key, axis_len, axis)
+    return global_key
+
+
+def _raise_idx(global_key, axis_len, axis):
+    """ Helper method to raise out of bounds IndexError, keeping message
+        formatting off of the bounds checking path """
+    raise IndexError(_OUT_OF_BOUNDS_MSG.format(global_key, axis, axis_len))
+
+
+def _global_to_local_key_int(global_key, globalshape,
+                             local_to_global_dict, axis):
+    """ Helper method to process int keys of distributed arrays """
+    global_key = _validate_int(global_key, globalshape[axis], axis)
 
     global_min, global_max = local_to_global_dict[axis]
-    if global_key >= global_min and global_key < global_max:
+    if global_min <= global_key < global_max:
         local_key = global_key - global_min
     else: #Don't slice/access
         local_key = slice(0, 0)
@@ -613,48 +830,109 @@ def _global_to_local_key_int(global_key, globalshape,
 
 
 def _global_to_local_key_slice(global_key, globalshape,
-                               local_to_global_dict, axis=0):
-    """ Helper method to process slice keys """
-    if global_key == slice(None):
-        return global_key
-    if local_to_global_dict is None:
+                               local_to_global_dict, axis):
+    """ Helper method to process slice keys of distributed arrays """
+    if global_key == _FULL_SLICE:
         return global_key
 
-    global_start, global_stop, global_step = \
-        global_key.indices(globalshape[axis])
     global_min, global_max = local_to_global_dict[axis]
 
-    #Condition slice start/stop
-    global_start = global_start if global_start is not None else 0
-    global_stop = \
-        global_stop if global_stop is not None else globalshape[axis]
-    #Bias start/stop by local min/max
-    local_start = global_start - global_min
+    return _local_slice(*global_key.indices(globalshape[axis]),
+                        int(global_min), int(global_max))
+
+
+def _local_slice(global_start, global_stop, global_step,
+                 global_min, global_max):
+    """ Helper method to translate normalized global slice indices to local
+        slice, clipped to local [global_min, global_max) index range and
+        aligned with the slice step """
+    if global_step > 0:
+        #First selected index within local range
+        if global_start < global_min:
+            global_start = \
+                global_min + (global_start - global_min) % global_step
+        global_stop = min(global_stop, global_max)
+        if global_start >= global_stop: #Don't slice/access
+            return slice(0, 0)
+        return slice(global_start - global_min,
+                     global_stop - global_min,
+                     global_step)
+
+    #Descending slices, first selected index within local range
+    global_last = global_max - 1
+    if global_start > global_last:
+        global_start = \
+            global_last - (global_last - global_start) % -global_step
+    global_stop = max(global_stop, global_min - 1)
+    if global_start <= global_stop: #Don't slice/access
+        return slice(0, 0)
+    #Negative stop would wrap around, run through local start instead
     local_stop = global_stop - global_min
+    return slice(global_start - global_min,
+                 local_stop if local_stop >= 0 else None,
+                 global_step)
+
+
+def _ascending_row_key(global_key, globalshape):
+    """ Helper method to convert descending row slice of key to ascending
+        slice selecting the same rows, None if rows aren't descending """
+    row_key = global_key[0] \
+        if isinstance(global_key, tuple) and len(global_key) > 0 else global_key
+    if not isinstance(row_key, slice) or \
+       row_key.step is None or row_key.step > 0:
+        return None
 
-    local_key = slice(local_start, local_stop, global_step)
+    start, stop, step = row_key.indices(globalshape[0])
+    num_rows = len(range(start, stop, step))
+    if num_rows == 0:
+        return None
+    ascending_row_key = slice(start + (num_rows - 1) * step, start + 1, -step)
 
-    return local_key
+    if isinstance(global_key, tuple):
+        return (ascending_row_key,) + global_key[1:]
+    return ascending_row_key
 
 
 def _global_to_local_key_tuple(global_key, globalshape, local_to_global_dict):
     """ Helper method to process tuple of int or slice keys """
     if len(global_key) > len(globalshape):
-        raise IndexError('too many indices for array with'  +
-                         ' global shape {}'.format(globalshape))
-
+        raise IndexError(_TOO_MANY_INDICES_MSG.format(globalshape))
+
+    #Int/slice translation inlined, axis properties looked up once per axis
+    undistributed = local_to_global_dict is None
+    #Convert array bounds to Python ints in a single call, rather than
+    ## operating on numpy scalars per axis
+    if isinstance(local_to_global_dict, np.ndarray):
+        local_to_global_dict = local_to_global_dict.tolist()
     local_key = []
     for axis, dim_key in enumerate(global_key):
-        if isinstance(dim_key, int):
-            local_key.append(_global_to_local_key_int(dim_key,
-                                                      globalshape,
-                                                      local_to_global_dict,
-                                                      axis))
-        if isinstance(dim_key, slice):
-            local_key.append(_global_to_local_key_slice(dim_key,
-                                                        globalshape,
-                                                        local_to_global_dict,
-                                                        axis))
+        axis_len = globalshape[axis]
+        if isinstance(dim_key, _INTEGER_TYPES):
+            # Handle negative/reverse access case
+            if dim_key < 0:
+                dim_key += axis_len
+            if not 0 <= dim_key < axis_len:
+                _raise_idx(dim_key, axis_len, axis)
+            if undistributed:
+                continue
+            global_min, global_max = local_to_global_dict[axis]
+            if global_min <= dim_key < global_max:
+                local_key.append(dim_key - global_min)
+            else: #Don't slice/access
+                local_key.append(slice(0, 0))
+        elif isinstance(dim_key, slice):
+            if undistributed:
+                continue
+            if dim_key == _FULL_SLICE:
+                local_key.append(dim_key)
+                continue
+            global_min, global_max = local_to_global_dict[axis]
+            local_key.append(_local_slice(*dim_key.indices(axis_len),
+                                          global_min, global_max))
+
+    #Undistributed keys only require validation
+    if undistributed:
+        return global_key
 
     return tuple(local_key)
 
@@ -675,7 +953,7 @@ def is_Replicated(distribution):
     -------
     result : boolean
     """
-    return distribution == 'r'
+    return _is_distribution(_hashable_distribution(distribution), 'r')
 
 
 def is_block_distributed(distribution):
@@ -694,10 +972,21 @@ def is_block_distributed(distribution):
     -------
     result : boolean
     """
-    return distribution[0] == 'b' and len(distribution) == 1
+    return _is_distribution(_hashable_distribution(distribution), 'b')
+
+
+@lru_cache(maxsize=32)
+def _is_distribution(distribution, code):
+    """ Helper method to check, and memoize, if distribution is the single
+        character distribution code, optionally as a single axis tuple """
+    if isinstance(distribution, str):
+        return distribution == code
+    return isinstance(distribution, tuple) and \
+           len(distribution) == 1 and distribution[0] == code
 
 #NOTE: Legacy method, good candidate for removal
-def slice_local_data_and_determine_mapping(array_data, dist, comm_dims, comm_coord):
+def slice_local_data_and_determine_mapping(array_data, dist, comm_dims, comm_coord,
+                                           ensure_contiguous=False):
     """ Slice array like data to be distributed among processes and determine
         its local to global mapping
 
@@ -715,6 +1004,10 @@ def slice_local_data_and_determine_mapping(array_data, dist, comm_dims, comm_coo
         Division of processes in cartesian grid
     comm_coord : list
         Coordinates of rank in grid
+    ensure_contiguous : bool, optional
+        Return C contiguous numpy array local data, copying only when the
+        sliced data isn't already contiguous.  Required when local data is
+        communicated through buffer based MPI routines.  Default False.
 
     Returns
     -------
@@ -730,16 +1023,20 @@ def slice_local_data_and_determine_mapping(array_data, dist, comm_dims, comm_coo
     """
     if is_Replicated(dist):
         local_to_global = None
+        if ensure_contiguous:
+            array_data = np.ascontiguousarray(array_data)
         return array_data, local_to_global
 
-    local_to_global = {}
-    for axis, axis_length in enumerate(np.shape(array_data)):
-        if axis == 0:
-            row_start, row_end = get_block_index(axis_length,
-                                                 comm_dims[0],
-                                                 comm_coord[0])
-            local_to_global[axis] = (int(row_start), int(row_end))
-        else:
-            local_to_global[axis] = (0, int(axis_length))
-
-    return array_data[slice(row_start, row_end)], local_to_global
+    #Only leading axis is distributed, remaining axes are entirely local
+    shape = getattr(array_data, 'shape', None)
+    if shape is None:
+        shape = np.shape(array_data)
+    row_start, row_end = get_block_index(shape[0],
+                                         comm_dims[0],
+                                         comm_coord[0])
+    local_to_global = _row_block_local_to_global(shape, row_start, row_end)
+    local_data = array_data[row_start:row_end]
+    if ensure_contiguous:
+        local_data = np.ascontiguousarray(local_data)
+
+    return local_data, local_to_global
@@ -1,4 +1,5 @@
 import unittest
+import unittest.mock as mock
 import numpy as np
 from mpi4py import MPI
 import mpids.MPInumpy as mpi_np
@@ -457,6 +458,49 @@ class MPIArrayIndexingDefaultTest(unittest.TestCase):
         self.assertTrue(np.alltrue(returned_array == self.data[:, middle_col:last_col]))
 
 
+    def test_custom_getitem_individual_locations_return(self):
+        rows, columns = self.data.shape
+        for row in range(-rows, rows):
+            for column in range(-columns, columns):
+                returned_array = self.mpi_array[row, column]
+
+                self.assertTrue(isinstance(returned_array, Replicated))
+                self.assertEqual(returned_array.globalsize, 1)
+                self.assertEqual(returned_array.dtype, self.data.dtype)
+                self.assertEqual(returned_array, self.data[row, column])
+
+
+    def test_custom_getitem_numpy_integer_keys_return(self):
+        for row in range(self.data.shape[0]):
+            self.assertTrue(np.alltrue(self.mpi_array[np.int64(row)] ==
+                                       self.data[row]))
+            self.assertEqual(self.mpi_array[np.int64(row), np.int32(row)],
+                             self.data[row, row])
+
+
+    def test_custom_getitem_single_row_not_gathered(self):
+        #Rows held by a single process are broadcast from it, not gathered
+        with mock.patch('mpids.MPInumpy.distributions.Block.all_gather_v') \
+            as mock_obj:
+            for row in range(self.data.shape[0]):
+                self.assertTrue(np.alltrue(self.mpi_array[row] ==
+                                           self.data[row]))
+                self.assertTrue(np.alltrue(self.mpi_array[row, 1:] ==
+                                           self.data[row, 1:]))
+        mock_obj.assert_not_called()
+
+
+    def test_custom_getitem_stepped_slices_return(self):
+        #Stepped and descending slices spanning process boundaries
+        for key in [np.s_[1::3], np.s_[::2], np.s_[3::-1], np.s_[::-2],
+                    np.s_[-1:0:-3], np.s_[1::3, ::-2], np.s_[::-1, 2]]:
+            returned_array = self.mpi_array[key]
+
+            self.assertTrue(isinstance(returned_array, Replicated))
+            self.assertEqual(returned_array.shape, self.data[key].shape)
+            self.assertTrue(np.alltrue(returned_array == self.data[key]))
+
+
 class MPIArrayIndexingReplicatedTest(MPIArrayIndexingDefaultTest):
 
     def create_setUp_parms(self):
@@ -47,6 +47,14 @@ class MPIArray3DDefaultTest(MPIArrayDefaultTest):
         self.assertTrue(np.alltrue(self.np_array.min(axis=2) == self.mpi_array.min(axis=2)))
 
 
+    def test_custom_minmax_higher_dim_method(self):
+        #Min/max along specified axies
+        for axis in [2]:
+            mpi_min, mpi_max = self.mpi_array.minmax(axis=axis)
+            self.assertTrue(np.alltrue(self.np_array.min(axis=axis) == mpi_min))
+            self.assertTrue(np.alltrue(self.np_array.max(axis=axis) == mpi_max))
+
+
     def test_custom_std_higher_dim_method(self):
         #Std along specified axies
         self.assertTrue(np.alltrue(self.np_array.std(axis=2) == self.mpi_array.std(axis=2)))
@@ -120,6 +128,14 @@ class MPIArray4DDefaultTest(MPIArrayDefaultTest):
         self.assertTrue(np.alltrue(self.np_array.min(axis=3) == self.mpi_array.min(axis=3)))
 
 
+    def test_custom_minmax_higher_dim_method(self):
+        #Min/max along specified axies
+        for axis in [2, 3]:
+            mpi_min, mpi_max = self.mpi_array.minmax(axis=axis)
+            self.assertTrue(np.alltrue(self.np_array.min(axis=axis) == mpi_min))
+            self.assertTrue(np.alltrue(self.np_array.max(axis=axis) == mpi_max))
+
+
     def test_custom_std_higher_dim_method(self):
         if isinstance(self.mpi_array, Replicated):
             #Std along specified axies
@@ -205,6 +221,14 @@ class MPIArray5DDefaultTest(MPIArrayDefaultTest):
         self.assertTrue(np.alltrue(self.np_array.min(axis=4) == self.mpi_array.min(axis=4)))
 
 
+    def test_custom_minmax_higher_dim_method(self):
+        #Min/max along specified axies
+        for axis in [2, 3, 4]:
+            mpi_min, mpi_max = self.mpi_array.minmax(axis=axis)
+            self.assertTrue(np.alltrue(self.np_array.min(axis=axis) == mpi_min))
+            self.assertTrue(np.alltrue(self.np_array.max(axis=axis) == mpi_max))
+
+
     def test_custom_std_higher_dim_method(self):
         if isinstance(self.mpi_array, Replicated):
             #Std along specified axies
@@ -1,4 +1,5 @@
 import unittest
+import unittest.mock as mock
 import numpy as np
 from mpi4py import MPI
 import mpids.MPInumpy as mpi_np
@@ -262,6 +263,46 @@ class MPIArrayReshapeDefaultTest(unittest.TestCase):
                 self.assertEqual(0, mpi_array_2x2x2x2.size)
 
 
+    def test_repeated_reshape_matches_initial_reshape(self):
+        mpi_array_2x8 = self.mpi_array.reshape(2, 8)
+        if isinstance(self.mpi_array, Replicated):
+            repeated_mpi_array_2x8 = self.mpi_array.reshape(2, 8)
+        else:
+            #Redistribution plan reused, no need to redetermine it
+            with mock.patch('mpids.MPInumpy.distributions.Block.plan_distribution') \
+                as mock_obj:
+                repeated_mpi_array_2x8 = self.mpi_array.reshape(2, 8)
+            mock_obj.assert_not_called()
+
+        self.assertEqual(mpi_array_2x8.globalshape,
+                         repeated_mpi_array_2x8.globalshape)
+        self.assertEqual(mpi_array_2x8.comm_dims,
+                         repeated_mpi_array_2x8.comm_dims)
+        self.assertEqual(mpi_array_2x8.comm_coord,
+                         repeated_mpi_array_2x8.comm_coord)
+        self.assertEqual(mpi_array_2x8.local_to_global,
+                         repeated_mpi_array_2x8.local_to_global)
+        self.assertTrue(np.alltrue(mpi_array_2x8 == repeated_mpi_array_2x8))
+        self.assertTrue(np.alltrue(self.np_array.reshape(2, 8) ==
+                                   repeated_mpi_array_2x8.collect_data()))
+
+
+    def test_reshape_on_communicators_with_differing_plan_histories(self):
+        #Processes sharing second communicator hold different cached plans
+        ## from the first, reshaping must not depend on matching cache hits
+        world_rank = self.comm.Get_rank()
+        first_comm = self.comm.Split(world_rank // 2)
+        second_comm = self.comm.Split(world_rank % 2)
+        np_data = np.arange(24).reshape(6, 4)
+        for sub_comm in [first_comm, second_comm]:
+            mpi_array = mpi_np.array(np_data, comm=sub_comm, dist=self.dist)
+            mpi_array_3x8 = mpi_array.reshape(3, 8)
+            self.assertTrue(np.alltrue(np_data.reshape(3, 8) ==
+                                       mpi_array_3x8.collect_data()))
+        first_comm.Free()
+        second_comm.Free()
+
+
 class MPIArrayReshapeReplicatedTest(MPIArrayReshapeDefaultTest):
 
     def create_setUp_parms(self):
@@ -48,6 +48,9 @@ class MPIArrayAbstractBaseClassTest(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.mpi_array.min()
 
+        with self.assertRaises(NotImplementedError):
+            self.mpi_array.minmax()
+
         with self.assertRaises(NotImplementedError):
             self.mpi_array.std()
 
@@ -142,6 +145,27 @@ class MPIArrayDefaultTest(unittest.TestCase):
             self.assertTrue(isinstance(self.mpi_array.local_to_global, dict))
             self.assertTrue(isinstance(self.mpi_array.local_to_global[0], tuple))
             self.assertTrue(isinstance(self.mpi_array.local_to_global[0][0], int))
+            #Contiguous storage backing local_to_global
+            self.assertTrue(isinstance(self.mpi_array._l2g, np.ndarray))
+            self.assertEqual(np.int64, self.mpi_array._l2g.dtype)
+            self.assertEqual((self.np_array.ndim, 2), self.mpi_array._l2g.shape)
+            #Array form of local_to_global accepted as is
+            l2g_array_mpi_array = self.mpi_array.__class__(
+                self.np_local_array, comm=self.comm,
+                comm_dims=self.comm_dims, comm_coord=self.comm_coord,
+                local_to_global=self.mpi_array._l2g)
+            self.assertTrue(np.shares_memory(l2g_array_mpi_array._l2g,
+                                            self.mpi_array._l2g))
+            self.assertEqual(self.local_to_global,
+                             l2g_array_mpi_array.local_to_global)
+            #Tuple form of local_to_global accepted
+            l2g_tuple_mpi_array = self.mpi_array.__class__(
+                self.np_local_array, comm=self.comm,
+                comm_dims=self.comm_dims, comm_coord=self.comm_coord,
+                local_to_global=tuple(self.local_to_global[axis]
+                    for axis in sorted(self.local_to_global)))
+            self.assertEqual(self.local_to_global,
+                             l2g_tuple_mpi_array.local_to_global)
         self.assertTrue(isinstance(self.mpi_array.globalsize, int))
         self.assertTrue(isinstance(self.mpi_array.globalnbytes, int))
         self.assertTrue(isinstance(self.mpi_array.globalndim, int))
@@ -247,6 +271,50 @@ class MPIArrayDefaultTest(unittest.TestCase):
             self.mpi_array.max(out=mpi_out)
 
 
+    def test_custom_minmax_method(self):
+        #Returned objects are Replicated
+        mpi_min, mpi_max = self.mpi_array.minmax()
+        self.assertTrue(isinstance(mpi_min, Replicated))
+        self.assertTrue(isinstance(mpi_max, Replicated))
+
+        #Default min/max of entire array contents
+        self.assertEqual(self.np_array.min(), mpi_min)
+        self.assertEqual(self.np_array.max(), mpi_max)
+
+        #Min/max along specified axies
+        for axis in [0, 1]:
+            mpi_min, mpi_max = self.mpi_array.minmax(axis=axis)
+            self.assertTrue(np.alltrue(self.np_array.min(axis=axis) == mpi_min))
+            self.assertTrue(np.alltrue(self.np_array.max(axis=axis) == mpi_max))
+        with self.assertRaises(ValueError):
+            self.mpi_array.minmax(axis=self.mpi_array.ndim)
+
+        #Use of 'out' field
+        mpi_out = np.zeros(())
+        with self.assertRaises(NotSupportedError):
+            self.mpi_array.minmax(out=mpi_out)
+
+
+    def test_custom_minmax_method_dtype_extremes(self):
+        #Order reversal of maximums must hold for full range of each dtype
+        for dtype in [np.int64, np.uint8, np.float64, np.bool_]:
+            if np.issubdtype(dtype, np.integer):
+                info = np.iinfo(dtype)
+                np_data = np.array([[info.min, info.max], [1, 0]] * 4,
+                                   dtype=dtype)
+            elif dtype == np.float64:
+                np_data = np.array([[-np.inf, np.inf], [1, 0]] * 4,
+                                   dtype=dtype)
+            else:
+                np_data = np.array([[True, False], [True, True]] * 4)
+            mpi_array = mpi_np.array(np_data, comm=self.comm, dist=self.dist)
+            for axis in [None, 0]:
+                mpi_min, mpi_max = mpi_array.minmax(axis=axis)
+                self.assertEqual(np_data.min(axis=axis).dtype, mpi_min.dtype)
+                self.assertTrue(np.alltrue(np_data.min(axis=axis) == mpi_min))
+                self.assertTrue(np.alltrue(np_data.max(axis=axis) == mpi_max))
+
+
     def test_custom_mean_method(self):
         #Returned object is Replicated
         self.assertTrue(isinstance(self.mpi_array.mean(), Replicated))
@@ -304,6 +372,23 @@ class MPIArrayDefaultTest(unittest.TestCase):
             self.mpi_array.std(out=mpi_out)
 
 
+    def test_custom_std_method_large_mean_small_spread(self):
+        #Ill conditioned data, naive sum of squares loses all significance
+        #Replicated std is numpy's own local std
+        if isinstance(self.mpi_array, Replicated):
+            return
+        random_state = np.random.RandomState(0)
+        for dtype, rtol in [(np.float32, 1e-3), (np.float64, 1e-9)]:
+            np_data = (1e4 + random_state.randn(100000, 2)).astype(dtype)
+            mpi_data = mpi_np.array(np_data, comm=self.comm, dist=self.dist)
+            for axis in [None, 0]:
+                #Reference computed in double precision
+                np_std = np_data.astype(np.float64).std(axis=axis)
+                mpi_std = mpi_data.std(axis=axis)
+                self.assertEqual(np_data.std(axis=axis).dtype, mpi_std.dtype)
+                self.assertTrue(np.allclose(np_std, mpi_std, rtol=rtol, atol=0))
+
+
     def test_custom_sum_method(self):
         #Returned object is Replicated
         self.assertTrue(isinstance(self.mpi_array.sum(), Replicated))
@@ -427,5 +512,42 @@ class MPIArrayReplicatedTest(MPIArrayDefaultTest):
         self.assertEqual(hex(np_scalar), hex(mpi_scalar))
 
 
+class MPIArraySingleProcessTest(unittest.TestCase):
+
+    def setUp(self):
+        self.comm = MPI.COMM_SELF
+        self.np_array = np.arange(25).reshape(5,5) + 1
+        self.mpi_array = mpi_np.array(self.np_array, comm=self.comm, dist='b')
+
+
+    def test_global_properties_match_local_properties(self):
+        self.assertEqual(self.np_array.shape, self.mpi_array.globalshape)
+        self.assertEqual(self.np_array.size, self.mpi_array.globalsize)
+        self.assertEqual(self.np_array.nbytes, self.mpi_array.globalnbytes)
+        self.assertEqual(self.np_array.ndim, self.mpi_array.globalndim)
+
+
+    def test_collect_data_returns_copy_of_local_data(self):
+        collected_array = self.mpi_array.collect_data()
+
+        self.assertTrue(isinstance(collected_array, Replicated))
+        self.assertTrue(np.alltrue(self.np_array == collected_array))
+        self.assertFalse(np.shares_memory(collected_array, self.mpi_array))
+
+
+    def test_reductions_match_numpy(self):
+        for axis in [None, 0, 1]:
+            self.assertTrue(np.alltrue(self.np_array.max(axis=axis) ==
+                                       self.mpi_array.max(axis=axis)))
+            self.assertTrue(np.alltrue(self.np_array.min(axis=axis) ==
+                                       self.mpi_array.min(axis=axis)))
+            self.assertTrue(np.alltrue(self.np_array.sum(axis=axis) ==
+                                       self.mpi_array.sum(axis=axis)))
+            self.assertTrue(np.allclose(self.np_array.mean(axis=axis),
+                                        self.mpi_array.mean(axis=axis)))
+            self.assertTrue(np.allclose(self.np_array.std(axis=axis),
+                                        self.mpi_array.std(axis=axis)))
+
+
 if __name__ == '__main__':
     unittest.main()
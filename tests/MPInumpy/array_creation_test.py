@@ -146,6 +146,22 @@ class ArrayReplicatedTest(ArrayDefaultTest):
         return parms
 
 
+    def test_return_behavior_with_0d_data_from_all_ranks(self):
+        for root in range(self.size):
+            scalar_data = None
+            self.assertTrue(scalar_data is None)
+            if self.rank == root:
+                scalar_data = 5
+            mpi_np_array = mpi_np.array(scalar_data,
+                                        comm=self.comm,
+                                        root=root,
+                                        dist=self.dist)
+            self.assertTrue(isinstance(mpi_np_array, self.dist_class))
+            self.assertEqual(mpi_np_array.shape, ())
+            self.assertEqual(mpi_np_array.globalshape, ())
+            self.assertTrue(np.alltrue(mpi_np_array == 5))
+
+
 class ArangeDefaultTest(unittest.TestCase):
 
     def create_setUp_parms(self):
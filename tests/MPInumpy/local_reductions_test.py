@@ -0,0 +1,69 @@
+import os
+import unittest
+import unittest.mock as mock
+import numpy as np
+from mpids.MPInumpy._local_reductions import local_reduction, \
+                                             _local_cores, \
+                                             _num_local_threads, \
+                                             _PARALLEL_KERNELS, \
+                                             _PARALLEL_THRESHOLD, \
+                                             _THREADS_ENV_VAR
+
+
+class LocalReductionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.small_data = np.arange(25, dtype=np.float64).reshape(5,5) - 12
+        #Large enough to use thread parallel kernels if available
+        self.large_data = \
+            np.random.RandomState(0).rand(2 * _PARALLEL_THRESHOLD + 1) - 0.5
+        self.methods = ['max', 'min', 'sum']
+
+
+    def test_reduction_of_entire_array_matches_numpy(self):
+        for data in [self.small_data, self.large_data]:
+            for method in self.methods:
+                local_result = local_reduction(data, method)
+                self.assertEqual(data.dtype, local_result.dtype)
+                self.assertTrue(np.isclose(getattr(data, method)(),
+                                           local_result))
+
+
+    def test_reduction_along_axis_matches_numpy(self):
+        for method in self.methods:
+            for axis in [0, 1]:
+                self.assertTrue(np.alltrue(
+                    getattr(self.small_data, method)(axis=axis) ==
+                    local_reduction(self.small_data, method, axis=axis)))
+
+
+    def test_reduction_of_non_float_and_strided_data_matches_numpy(self):
+        int_data = np.arange(2 * _PARALLEL_THRESHOLD)
+        strided_data = self.large_data[::2]
+        for data in [int_data, strided_data]:
+            for method in self.methods:
+                self.assertTrue(np.isclose(getattr(data, method)(),
+                                           local_reduction(data, method)))
+
+
+    def test_local_threads_opt_in_and_limited_to_local_cores(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop(_THREADS_ENV_VAR, None)
+            self.assertEqual(_num_local_threads(), 1)
+
+        oversubscribed = {_THREADS_ENV_VAR: str(_local_cores() + 1)}
+        with mock.patch.dict(os.environ, oversubscribed):
+            self.assertEqual(_num_local_threads(), _local_cores())
+
+
+    @unittest.skipIf(not _PARALLEL_KERNELS,
+                     "Thread parallel kernels not enabled")
+    def test_parallel_kernels_propagate_nan(self):
+        nan_data = np.copy(self.large_data)
+        nan_data[_PARALLEL_THRESHOLD] = np.nan
+        for method in self.methods:
+            self.assertTrue(np.isnan(local_reduction(nan_data, method)))
+
+
+if __name__ == '__main__':
+    unittest.main()
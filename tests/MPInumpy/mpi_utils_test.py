@@ -3,7 +3,8 @@ from mpi4py import MPI
 import numpy as np
 
 from mpids.MPInumpy.mpi_utils import *
-from mpids.MPInumpy.mpi_utils import _displacments_from_counts
+from mpids.MPInumpy.mpi_utils import _displacments_from_counts, _mpi_dtype, \
+                                     _scratch_buffer
 from mpids.MPInumpy.errors import TypeError
 
 
@@ -21,6 +22,28 @@ class HelperGetters(unittest.TestCase):
         self.assertEqual(MPI.COMM_WORLD.size, get_comm_size())
 
 
+    def test_scratch_buffer_reuses_buffers(self):
+        counts = _scratch_buffer('test_counts', 4, np.int32)
+        self.assertEqual((4,), counts.shape)
+        self.assertEqual(np.int32, counts.dtype)
+        #Same request returns same buffer
+        self.assertTrue(counts is _scratch_buffer('test_counts', 4, np.int32))
+        #Unique buffer for differing name, length, or data type
+        self.assertTrue(counts is not _scratch_buffer('test_displs', 4, np.int32))
+        self.assertTrue(counts is not _scratch_buffer('test_counts', 5, np.int32))
+        self.assertTrue(counts is not _scratch_buffer('test_counts', 4, np.int64))
+
+
+    def test_mpi_dtype_provides_equivalent_mpi_datatype(self):
+        for dtype in [np.int32, np.int64, np.float64, np.complex128]:
+            dtype_char = np.dtype(dtype).char
+            mpi_dtype = _mpi_dtype(dtype_char)
+            self.assertEqual(MPI._typedict[dtype_char], mpi_dtype)
+            self.assertEqual(np.dtype(dtype).itemsize, mpi_dtype.Get_size())
+            #Repeated lookups return memoized datatype
+            self.assertTrue(mpi_dtype is _mpi_dtype(dtype_char))
+
+
 class AllGatherVTest(unittest.TestCase):
 
     def setUp(self):
@@ -64,6 +87,15 @@ class AllGatherVTest(unittest.TestCase):
         self.assertTrue(np.alltrue((array_1) == (array_2)))
 
 
+    def test_gather_returns_contiguous_buffer_separate_from_local_data(self):
+        gathered_data = all_gather_v(self.local_data_2d,
+                                     shape=self.global_data_2d.shape)
+
+        self.arrays_are_equivelant(gathered_data, self.global_data_2d)
+        self.assertTrue(gathered_data.flags['C_CONTIGUOUS'])
+        self.assertFalse(np.shares_memory(gathered_data, self.local_data_2d))
+
+
     def test_gather_empty_value_found_on_all_procs(self):
         local_data = np.array([])
         expected_gathered_data = np.array([] * self.num_procs)
@@ -542,6 +574,20 @@ class AllToAllVTest(unittest.TestCase):
             self.arrays_are_equivelant(received_array, expected_received_array)
 
 
+    def test_all_to_all_v_returns_contiguous_owned_buffer(self):
+        send_counts = np.array([0] * self.size)
+        send_counts[self.rank] = self.distributed_data_1d_int.size
+        recv_counts = np.array([0] * self.size)
+        recv_counts[self.rank] = self.distributed_data_1d_int.size
+
+        received_array = \
+            all_to_all_v(self.distributed_data_1d_int, send_counts, recv_counts)
+
+        self.assertTrue(received_array.flags['C_CONTIGUOUS'])
+        self.assertFalse(np.shares_memory(received_array,
+                                          self.distributed_data_1d_int))
+
+
 class BroadcastShapeTest(unittest.TestCase):
 
     def setUp(self):
@@ -631,6 +677,17 @@ class BroadcastArrayTest(unittest.TestCase):
             self.arrays_are_equivelant(local_data, self.data_2d_float)
 
 
+    def test_broadcasting_0d_int_array_from_all_ranks(self):
+        data_0d_int = np.array(5)
+        for root in range(self.size):
+            local_data = None
+            self.assertTrue(local_data is None)
+            if self.rank == root:
+                local_data = data_0d_int
+            local_data = broadcast_array(local_data, comm=self.comm, root=root)
+            self.arrays_are_equivelant(local_data, data_0d_int)
+
+
 class ScatterVTest(unittest.TestCase):
 
     def setUp(self):
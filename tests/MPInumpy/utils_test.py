@@ -1,3 +1,4 @@
+import itertools
 import unittest
 import unittest.mock as mock
 import numpy as np
@@ -6,7 +7,8 @@ from mpids.MPInumpy.utils import *
 from mpids.MPInumpy.utils import format_indexed_result,     \
                                  _global_to_local_key_int,   \
                                  _global_to_local_key_slice, \
-                                 _global_to_local_key_tuple
+                                 _global_to_local_key_tuple, \
+                                 _validate_int
 from mpids.MPInumpy.errors import InvalidDistributionError, NotSupportedError
 
 class UtilsDistributionIndependentTest(unittest.TestCase):
@@ -28,6 +30,18 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         self.assertTrue(is_block_distributed(block))
         self.assertFalse(is_block_distributed(undist))
 
+        #Single axis distributions as list/tuple
+        for dist_type in [list, tuple]:
+            self.assertTrue(is_Replicated(dist_type(undist)))
+            self.assertFalse(is_Replicated(dist_type(block)))
+            self.assertTrue(is_block_distributed(dist_type(block)))
+            self.assertFalse(is_block_distributed(dist_type(undist)))
+
+        #Multiple character/axis distributions are neither
+        for dist in ['bb', 'rr', ('b', 'b'), ['r', 'r'], '', ()]:
+            self.assertFalse(is_Replicated(dist))
+            self.assertFalse(is_block_distributed(dist))
+
 
     def test_get_block_index(self):
         data_length = 10
@@ -43,6 +57,32 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
                          get_block_index(data_length, num_procs, 2))
 
 
+    def test_get_block_indices_all(self):
+        for data_length in [0, 1, 3, 10, 12]:
+            for num_procs in [1, 3, 4]:
+                start_indices, end_indices = \
+                    get_block_indices_all(data_length, num_procs)
+                self.assertEqual((num_procs,), start_indices.shape)
+                self.assertEqual((num_procs,), end_indices.shape)
+                for coord in range(num_procs):
+                    self.assertEqual(
+                        get_block_index(data_length, num_procs, coord),
+                        (start_indices[coord], end_indices[coord]))
+
+
+    def test_get_block_owner(self):
+        for data_length in [1, 3, 10, 12]:
+            for num_procs in [1, 3, 4]:
+                for coord in range(num_procs):
+                    start, end = \
+                        get_block_index(data_length, num_procs, coord)
+                    for index in range(start, end):
+                        self.assertEqual(coord,
+                                         get_block_owner(index,
+                                                         data_length,
+                                                         num_procs))
+
+
     def test_distribution_to_dimensions_with_invalid_distributions(self):
         procs = 4
         # Check unsupported distributions
@@ -52,6 +92,9 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
             distribution_to_dimensions(('','b'), procs)
         with self.assertRaises(InvalidDistributionError):
             distribution_to_dimensions(('r','r'), procs)
+        with self.assertRaisesRegex(InvalidDistributionError,
+            'Invalid distribution encountered: x'):
+            distribution_to_dimensions('x', procs)
 
 
     def test_global_to_local_key_int(self):
@@ -89,31 +132,32 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         self.assertEqual(slice(0, 0), non_slice)
 
         self.assertEqual(local_first_index,
-            _global_to_local_key_int(global_first_index, globalshape, local_to_global))
+            _global_to_local_key_int(global_first_index, globalshape, local_to_global, 0))
         self.assertEqual(local_second_index,
-            _global_to_local_key_int(global_second_index, globalshape, local_to_global))
+            _global_to_local_key_int(global_second_index, globalshape, local_to_global, 0))
         self.assertEqual(local_last_index,
-            _global_to_local_key_int(global_last_index, globalshape, local_to_global))
+            _global_to_local_key_int(global_last_index, globalshape, local_to_global, 0))
         self.assertEqual(non_slice,
-            _global_to_local_key_int(global_lower_outside_local_range, globalshape, local_to_global))
+            _global_to_local_key_int(global_lower_outside_local_range, globalshape, local_to_global, 0))
         self.assertEqual(non_slice,
-            _global_to_local_key_int(global_upper_outside_local_range, globalshape, local_to_global))
+            _global_to_local_key_int(global_upper_outside_local_range, globalshape, local_to_global, 0))
         self.assertEqual(local_negative_last_index,
-            _global_to_local_key_int(global_negative_last_index, globalshape, local_to_global))
+            _global_to_local_key_int(global_negative_last_index, globalshape, local_to_global, 0))
         self.assertEqual(non_slice,
-            _global_to_local_key_int(global_negative_index_outside_range, globalshape, local_to_global))
+            _global_to_local_key_int(global_negative_index_outside_range, globalshape, local_to_global, 0))
 
-        #Global result for local_to_global defined as None
+        #Global result for local_to_global defined as None, undistributed
+        ## keys are resolved by global_to_local_key
         self.assertEqual(global_first_index,
-            _global_to_local_key_int(global_first_index, globalshape, None))
+            global_to_local_key(global_first_index, globalshape, None))
         self.assertEqual(global_second_index,
-            _global_to_local_key_int(global_second_index, globalshape, None))
+            global_to_local_key(global_second_index, globalshape, None))
         self.assertEqual(global_last_index,
-            _global_to_local_key_int(global_last_index, globalshape, None))
+            global_to_local_key(global_last_index, globalshape, None))
         self.assertEqual(global_lower_outside_local_range,
-            _global_to_local_key_int(global_lower_outside_local_range, globalshape, None))
+            global_to_local_key(global_lower_outside_local_range, globalshape, None))
         self.assertEqual(global_upper_outside_local_range,
-            _global_to_local_key_int(global_upper_outside_local_range, globalshape, None))
+            global_to_local_key(global_upper_outside_local_range, globalshape, None))
 
         #Check for index errors
         index_out_of_global_range = self.index_key_generator[5]
@@ -123,13 +167,28 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         self.assertEqual(-6, negative_index_out_of_global_range)
 
         with self.assertRaises(IndexError):
-            _global_to_local_key_int(index_out_of_global_range, globalshape, local_to_global)
+            _global_to_local_key_int(index_out_of_global_range, globalshape, local_to_global, 0)
+        with self.assertRaises(IndexError):
+            _global_to_local_key_int(negative_index_out_of_global_range, globalshape, local_to_global, 0)
         with self.assertRaises(IndexError):
-            _global_to_local_key_int(negative_index_out_of_global_range, globalshape, local_to_global)
+            global_to_local_key(index_out_of_global_range, globalshape, None)
         with self.assertRaises(IndexError):
-            _global_to_local_key_int(index_out_of_global_range, globalshape, None)
+            global_to_local_key(negative_index_out_of_global_range, globalshape, None)
+
+
+    def test_validate_int(self):
+        axis_len = 5
+        for global_key in range(axis_len):
+            self.assertEqual(global_key, _validate_int(global_key, axis_len, 0))
+            self.assertEqual(global_key,
+                             _validate_int(global_key - axis_len, axis_len, 0))
+        with self.assertRaises(IndexError):
+            _validate_int(axis_len, axis_len, 0)
         with self.assertRaises(IndexError):
-            _global_to_local_key_int(negative_index_out_of_global_range, globalshape, None)
+            _validate_int(-axis_len - 1, axis_len, 1)
+        with self.assertRaisesRegex(IndexError,
+            'index 7 is out of bounds for axis 1 with global shape 5'):
+            _validate_int(7, axis_len, 1)
 
 
     def test_global_to_local_key_slice(self):
@@ -158,28 +217,28 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         self.assertEqual(slice(1, 2, 1), local_second_index)
         self.assertEqual(slice(2, 3, 1), local_last_index)
 
-        #Note: below would slice nothing as the start/stops are
+        #Note: below slice nothing as the start/stops are
         #out of the local range
-        local_outside_min_range = self.index_key_generator[-1:0:1]
-        local_outside_max_range = self.index_key_generator[3:4:1]
+        local_outside_min_range = self.index_key_generator[0:0]
+        local_outside_max_range = self.index_key_generator[0:0]
         select_all = self.index_key_generator[:]
         #Check keys are what we expect
-        self.assertEqual(slice(-1, 0, 1), local_outside_min_range)
-        self.assertEqual(slice(3, 4, 1), local_outside_max_range)
+        self.assertEqual(slice(0, 0), local_outside_min_range)
+        self.assertEqual(slice(0, 0), local_outside_max_range)
         self.assertEqual(slice(None, None, None), select_all)
 
         self.assertEqual(select_all,
-            _global_to_local_key_slice(select_all, globalshape, local_to_global))
+            _global_to_local_key_slice(select_all, globalshape, local_to_global, 0))
         self.assertEqual(local_first_index,
-            _global_to_local_key_slice(global_first, globalshape, local_to_global))
+            _global_to_local_key_slice(global_first, globalshape, local_to_global, 0))
         self.assertEqual(local_second_index,
-            _global_to_local_key_slice(global_second, globalshape, local_to_global))
+            _global_to_local_key_slice(global_second, globalshape, local_to_global, 0))
         self.assertEqual(local_last_index,
-            _global_to_local_key_slice(global_last, globalshape, local_to_global))
+            _global_to_local_key_slice(global_last, globalshape, local_to_global, 0))
         self.assertEqual(local_outside_min_range,
-            _global_to_local_key_slice(global_lower_outside_local_range, globalshape, local_to_global))
+            _global_to_local_key_slice(global_lower_outside_local_range, globalshape, local_to_global, 0))
         self.assertEqual(local_outside_max_range,
-            _global_to_local_key_slice(global_upper_outside_local_range, globalshape, local_to_global))
+            _global_to_local_key_slice(global_upper_outside_local_range, globalshape, local_to_global, 0))
 
 
     def test_global_to_local_key_slice_with_steps(self):
@@ -196,25 +255,46 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         self.assertEqual(slice(0, 5, 3), global_last)
         self.assertEqual(slice(1, 4, 2), global_first_and_last)
 
-        #Expected Results
-        local_first = self.index_key_generator[0:4:3]
-        local_second = self.index_key_generator[-1:4:2]
-        local_last = self.index_key_generator[-1:4:3]
+        #Expected Results, clipped to local range and aligned with step
+        local_first = self.index_key_generator[0:3:3]
+        local_second = self.index_key_generator[1:3:2]
+        local_last = self.index_key_generator[2:3:3]
         local_first_and_last = self.index_key_generator[0:3:2]
         #Check keys are what we expect
-        self.assertEqual(slice(0, 4, 3), local_first)
-        self.assertEqual(slice(-1, 4, 2), local_second)
-        self.assertEqual(slice(-1, 4, 3), local_last)
+        self.assertEqual(slice(0, 3, 3), local_first)
+        self.assertEqual(slice(1, 3, 2), local_second)
+        self.assertEqual(slice(2, 3, 3), local_last)
         self.assertEqual(slice(0, 3, 2), local_first_and_last)
 
         self.assertEqual(local_first,
-            _global_to_local_key_slice(global_first, globalshape, local_to_global))
+            _global_to_local_key_slice(global_first, globalshape, local_to_global, 0))
         self.assertEqual(local_second,
-            _global_to_local_key_slice(global_second, globalshape, local_to_global))
+            _global_to_local_key_slice(global_second, globalshape, local_to_global, 0))
         self.assertEqual(local_last,
-            _global_to_local_key_slice(global_last, globalshape, local_to_global))
+            _global_to_local_key_slice(global_last, globalshape, local_to_global, 0))
         self.assertEqual(local_first_and_last,
-            _global_to_local_key_slice(global_first_and_last, globalshape, local_to_global))
+            _global_to_local_key_slice(global_first_and_last, globalshape, local_to_global, 0))
+
+        #Descending slices
+        self.assertEqual(slice(1, None, -2),
+            _global_to_local_key_slice(slice(None, None, -2), globalshape, local_to_global, 0))
+        self.assertEqual(slice(1, None, -1),
+            _global_to_local_key_slice(slice(2, None, -1), globalshape, local_to_global, 0))
+        self.assertEqual(slice(0, 0),
+            _global_to_local_key_slice(slice(4, 3, -1), globalshape, local_to_global, 0))
+
+        #Local keys select the same elements as global keys within local range
+        global_data = np.arange(globalshape[0])
+        local_data = global_data[1:4]
+        for start, stop, step in itertools.product([None, 0, 1, 3, 4, -1],
+                                                   [None, 0, 2, 4, 5, -5],
+                                                   [1, 2, 3, -1, -2, -3]):
+            global_key = slice(start, stop, step)
+            expected = [value for value in global_data[global_key]
+                        if value in local_data]
+            local_key = _global_to_local_key_slice(global_key, globalshape,
+                                                   local_to_global, 0)
+            self.assertEqual(expected, local_data[local_key].tolist())
 
 
     def test_global_to_local_key_tuple(self):
@@ -238,19 +318,6 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         self.assertEqual((slice(0, 1, 1), slice(0, 1, 1)), local_slice_tuple)
         self.assertEqual((0, slice(0, 1, 1)), local_mixed_tuple)
 
-        #Check that int/slice helper methods are called
-        with mock.patch('mpids.MPInumpy.utils._global_to_local_key_int') as mock_obj_int:
-            _global_to_local_key_tuple(int_tuple, globalshape, local_to_global)
-        calls = [mock.call(int_tuple[0], globalshape, local_to_global, 0),
-                 mock.call(int_tuple[1], globalshape, local_to_global, 1)]
-        mock_obj_int.assert_has_calls(calls)
-
-        with mock.patch('mpids.MPInumpy.utils._global_to_local_key_slice') as mock_obj_slice:
-            _global_to_local_key_tuple(slice_tuple, globalshape, local_to_global)
-        calls = [mock.call(slice_tuple[0], globalshape, local_to_global, 0),
-                 mock.call(slice_tuple[1], globalshape, local_to_global, 1)]
-        mock_obj_slice.assert_has_calls(calls)
-
         #Check return behavior
         self.assertEqual(local_int_tuple,
             _global_to_local_key_tuple(int_tuple, globalshape, local_to_global))
@@ -259,6 +326,19 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         self.assertEqual(local_mixed_tuple,
             _global_to_local_key_tuple(mixed_tuple, globalshape, local_to_global))
 
+        #Array form of local_to_global produces Python int local keys
+        local_to_global_array = np.array([[1, 4], [1, 4]], dtype=np.int64)
+        for global_key, local_key in [(int_tuple, local_int_tuple),
+                                      (slice_tuple, local_slice_tuple),
+                                      (mixed_tuple, local_mixed_tuple)]:
+            array_local_key = _global_to_local_key_tuple(global_key,
+                                                       globalshape,
+                                                       local_to_global_array)
+            self.assertEqual(local_key, array_local_key)
+        self.assertTrue(all(type(dim_key) is int for dim_key in
+            _global_to_local_key_tuple(int_tuple, globalshape,
+                                       local_to_global_array)))
+
         #Global result for local_to_global defined as None
         self.assertEqual(int_tuple,
                  _global_to_local_key_tuple(int_tuple, globalshape, None))
@@ -267,15 +347,15 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         self.assertEqual(mixed_tuple,
                  _global_to_local_key_tuple(mixed_tuple, globalshape, None))
 
-        #Check Index Error is propagated from _global_to_local_key_int
-        with mock.patch('mpids.MPInumpy.utils._global_to_local_key_int',
-                side_effect = IndexError('Error')) as mock_obj_int:
-            with self.assertRaises(IndexError):
-                _global_to_local_key_tuple((6, 6), globalshape, local_to_global)
-        with mock.patch('mpids.MPInumpy.utils._global_to_local_key_int',
-                side_effect = IndexError('Error')) as mock_obj_int:
-            with self.assertRaises(IndexError):
-                _global_to_local_key_tuple((6, 6), globalshape, None)
+        #Check Index Error is thrown for out of bounds int keys
+        with self.assertRaises(IndexError):
+            _global_to_local_key_tuple((6, 6), globalshape, local_to_global)
+        with self.assertRaises(IndexError):
+            _global_to_local_key_tuple((6, 6), globalshape, None)
+        with self.assertRaises(IndexError):
+            _global_to_local_key_tuple((0, -6), globalshape, local_to_global)
+        with self.assertRaises(IndexError):
+            _global_to_local_key_tuple((0, -6), globalshape, None)
 
         #Check Index Error is thrown when key has more dimensions
         #than total array shape
@@ -293,21 +373,33 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         #Check that int/slice/tuple helper methods are called
         with mock.patch('mpids.MPInumpy.utils._global_to_local_key_int') as mock_obj_int:
             global_to_local_key(1, globalshape, local_to_global)
-        mock_obj_int.assert_called_with(1, globalshape, local_to_global)
+        mock_obj_int.assert_called_with(1, globalshape, local_to_global, 0)
 
         with mock.patch('mpids.MPInumpy.utils._global_to_local_key_slice') as mock_obj_slice:
             global_to_local_key(slice(1, 2), globalshape, local_to_global)
-        mock_obj_slice.assert_called_with(slice(1, 2), globalshape, local_to_global)
+        mock_obj_slice.assert_called_with(slice(1, 2), globalshape, local_to_global, 0)
 
         with mock.patch('mpids.MPInumpy.utils._global_to_local_key_tuple') as mock_obj_tuple:
             global_to_local_key((1, 2), globalshape, local_to_global)
         mock_obj_tuple.assert_called_with((1, 2), globalshape, local_to_global)
 
+        #Tuple and array forms of local_to_global translate identically
+        local_to_global_forms = [((1, 4), (1, 4)),
+                                 np.array([[1, 4], [1, 4]], dtype=np.int64)]
+        for global_key in [0, 2, -2, slice(None), slice(0, 3), slice(None, None, -2),
+                           (2, 3), (0, slice(1, None)), (slice(2, 4), -1)]:
+            local_key = global_to_local_key(global_key, globalshape,
+                                            local_to_global)
+            for local_to_global_form in local_to_global_forms:
+                self.assertEqual(local_key,
+                                 global_to_local_key(global_key, globalshape,
+                                                     local_to_global_form))
+
         #Check Index Error is propagated from _global_to_local_key_int
         with mock.patch('mpids.MPInumpy.utils._global_to_local_key_int',
                 side_effect = IndexError('Error')) as mock_obj_int:
             with self.assertRaises(IndexError):
-                global_to_local_key((6, 6), globalshape, local_to_global)
+                global_to_local_key(6, globalshape, local_to_global)
 
         #Check Index Error is propagated from _global_to_local_key_tuple
         with mock.patch('mpids.MPInumpy.utils._global_to_local_key_tuple',
@@ -315,9 +407,30 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
             with self.assertRaises(IndexError):
                 global_to_local_key((0, 1, 2), globalshape, local_to_global)
 
+        #Check undistributed keys are returned without descending into helpers
+        with mock.patch('mpids.MPInumpy.utils._global_to_local_key_int') as mock_obj_int:
+            self.assertEqual(1, global_to_local_key(1, globalshape, None))
+        mock_obj_int.assert_not_called()
+        with mock.patch('mpids.MPInumpy.utils._global_to_local_key_slice') as mock_obj_slice:
+            self.assertEqual(slice(1, 2),
+                             global_to_local_key(slice(1, 2), globalshape, None))
+        mock_obj_slice.assert_not_called()
+
+        #Check numpy integer keys are treated as int keys
+        with mock.patch('mpids.MPInumpy.utils._global_to_local_key_int') as mock_obj_int:
+            global_to_local_key(np.int64(1), globalshape, local_to_global)
+        mock_obj_int.assert_called_with(np.int64(1), globalshape, local_to_global, 0)
+        self.assertEqual(global_to_local_key(1, globalshape, local_to_global),
+            global_to_local_key(np.int64(1), globalshape, local_to_global))
+        self.assertEqual(global_to_local_key((1, 1), globalshape, local_to_global),
+            global_to_local_key((np.int32(1), np.int64(1)), globalshape,
+                                local_to_global))
+
         #Check Not Supported Error is thrown when non int/slice/tuple key provided
         with self.assertRaises(NotSupportedError):
             global_to_local_key([0, 1], globalshape, local_to_global)
+        with self.assertRaises(NotSupportedError):
+            global_to_local_key(True, globalshape, local_to_global)
 
 
     def testformat_indexed_result(self):
@@ -353,6 +466,51 @@ class UtilsDistributionIndependentTest(unittest.TestCase):
         self.assertEqual(desired_empty_shape, formated_empty_array_tuple_slice.shape)
         self.assertEqual(empty_array.data.tolist(), formated_empty_array_tuple_slice.data.tolist())
 
+        formated_empty_array_np_int = format_indexed_result(np.int64(1), empty_array)
+        self.assertEqual(desired_scalar_empty_shape, formated_empty_array_np_int.shape)
+
+        formated_empty_array_tuple_mixed = format_indexed_result((1, slice(1,1)), empty_array)
+        self.assertEqual(desired_empty_shape, formated_empty_array_tuple_mixed.shape)
+
+        #Non-empty results keep their shape
+        non_empty_array = test_matrix[1:3]
+        self.assertEqual(non_empty_array.shape,
+                         format_indexed_result(slice(1,3), non_empty_array).shape)
+
+
+    def test_determine_indexed_globalshape(self):
+        globalshape = (5, 4)
+        test_matrix = np.arange(20).reshape(globalshape)
+
+        #Shapes match numpy results for non-empty keys
+        self.assertEqual(test_matrix[1].shape,
+                         determine_indexed_globalshape(1, globalshape))
+        self.assertEqual(test_matrix[-1].shape,
+                         determine_indexed_globalshape(-1, globalshape))
+        self.assertEqual(test_matrix[1:4].shape,
+                         determine_indexed_globalshape(slice(1, 4), globalshape))
+        self.assertEqual(test_matrix[::2].shape,
+                         determine_indexed_globalshape(slice(None, None, 2),
+                                                       globalshape))
+        self.assertEqual(test_matrix[:, 2].shape,
+                         determine_indexed_globalshape((slice(None), 2),
+                                                       globalshape))
+        self.assertEqual(test_matrix[:, 1:3].shape,
+                         determine_indexed_globalshape((slice(None), slice(1, 3)),
+                                                       globalshape))
+
+        #Scalar results formatted with a shape
+        self.assertEqual((1,), determine_indexed_globalshape((1, 1), globalshape))
+        self.assertEqual((1,), determine_indexed_globalshape(1, (5,)))
+
+        #Empty results formatted to match format_indexed_result
+        self.assertEqual((0, 0),
+                         determine_indexed_globalshape(slice(1, 1), globalshape))
+        self.assertEqual((0, 0),
+                         determine_indexed_globalshape((slice(None), slice(1, 1)),
+                                                       globalshape))
+        self.assertEqual((0,), determine_indexed_globalshape(1, (5, 0)))
+
 
     def test_determine_global_offset(self):
         #1D
@@ -557,9 +715,28 @@ class UtilsDefaultTest(unittest.TestCase):
         self.assertEqual(self.comm_dims, get_comm_dims(self.procs, self.dist))
 
 
+    def test_get_comm_dims_returns_independent_results(self):
+        comm_dims = get_comm_dims(self.procs, self.dist)
+        if comm_dims is None:
+            return
+        #Memoized results are not shared between callers
+        comm_dims.append(-1)
+        self.assertEqual(self.comm_dims, get_comm_dims(self.procs, self.dist))
+
+
     def test_get_cart_coords(self):
         self.assertEqual(self.comm_coord,
                  get_cart_coords(self.comm_dims, self.procs, self.rank))
+        if self.comm_dims is not None:
+            self.assertEqual(self.comm_coord,
+                     get_cart_coords(tuple(self.comm_dims), self.procs, self.rank))
+        #Higher dimensional grids follow row-major rank ordering
+        for comm_dims in [[2, 2], [3, 2], [2, 3, 2]]:
+            procs = int(np.prod(comm_dims))
+            for rank in range(procs):
+                self.assertEqual(
+                    list(np.unravel_index(rank, comm_dims)),
+                    get_cart_coords(comm_dims, procs, rank))
 
 
     def test_distribution_to_dimensions(self):
@@ -585,6 +762,12 @@ class UtilsDefaultTest(unittest.TestCase):
                          (comm_dims, comm_coord, local_to_global_2d))
         self.assertTrue(np.alltrue(self.local_data_2d == local_data_2d))
 
+        # Non-contiguous 2-D Data
+        local_data_2d, comm_dims, comm_coord, local_to_global_2d = \
+            distribute_array(np.asfortranarray(self.data_2d), self.dist)
+        self.assertEqual(self.local_to_global_2d, local_to_global_2d)
+        self.assertTrue(np.alltrue(self.local_data_2d == local_data_2d))
+
 
     def test_distribute_range(self):
         #providing only stop
@@ -632,6 +815,28 @@ class UtilsDefaultTest(unittest.TestCase):
             (tuple(local_shape_2d), comm_dims, comm_coord, local_to_global_2d))
 
 
+    def test_plan_distribution(self):
+        for shape, local_shape, local_to_global in \
+            [(self.data_shape, self.local_data_shape, self.local_to_global),
+             (self.data_2d_shape, self.local_data_2d_shape,
+              self.local_to_global_2d)]:
+            plan = plan_distribution(shape, self.dist, self.procs, self.rank)
+            self.assertEqual(local_shape, plan[0])
+            if is_Replicated(self.dist):
+                self.assertEqual((None, None, None), plan[1:])
+                continue
+            self.assertEqual(tuple(self.comm_dims), plan[1])
+            self.assertEqual(tuple(self.comm_coord), plan[2])
+            self.assertEqual(np.int64, plan[3].dtype)
+            self.assertFalse(plan[3].flags.writeable)
+            self.assertEqual([list(local_to_global[axis])
+                              for axis in sorted(local_to_global)],
+                             plan[3].tolist())
+            #Plans are memoized
+            self.assertTrue(plan is plan_distribution(list(shape), self.dist,
+                                                      self.procs, self.rank))
+
+
     def test_determine_local_shape_and_mapping(self):
         # 1-D Data
         self.assertEqual((self.local_data_shape, self.local_to_global),
@@ -666,6 +871,15 @@ class UtilsDefaultTest(unittest.TestCase):
         self.assertTrue(np.alltrue(self.local_data_2d == local_data_2d))
         self.assertEqual(self.local_to_global_2d, local_to_global)
 
+        # Contiguous local data of non-contiguous 2-D Data
+        local_data_2d, local_to_global = \
+            slice_local_data_and_determine_mapping(
+                np.asfortranarray(self.data_2d), self.dist,
+                self.comm_dims, self.comm_coord, ensure_contiguous=True)
+        self.assertTrue(local_data_2d.flags['C_CONTIGUOUS'])
+        self.assertTrue(np.alltrue(self.local_data_2d == local_data_2d))
+        self.assertEqual(self.local_to_global_2d, local_to_global)
+
 
 class UtilsReplicatedTest(UtilsDefaultTest):
 